@@ -1,6 +1,5 @@
-from typing import List
+from array import array
 from random import randint
-from time import perf_counter
 
 from core.memory import Memory
 from core.display import Display
@@ -33,29 +32,25 @@ class CPU:
        input_: Input subsystem reference
        registers: 16 8-bit registers (V0-VF, where VF is flags register)
        pc: 16-bit program counter
-       pc_modified: Flag to prevent auto-increment after jumps/calls
        i: 16-bit index register
        stack: 16-level call stack
        sp: Stack pointer (0-15)
        opcode: Currently executing 16-bit instruction
        delay_timer: 8-bit delay timer (decrements at 60Hz)
        sound_timer: 8-bit sound timer (decrements at 60Hz)
-       last_timer_update: Timestamp for 60Hz timer management
        waiting_for_key: Flag indicating CPU is blocked waiting for input
    """
    memory: Memory
    display: Display
    input_: Input_
-   registers: List[int]
+   registers: array
    pc: int
-   pc_modified: bool
    i: int
-   stack: List[int]
+   stack: array
    sp: int
    opcode: int
    delay_timer: int
    sound_timer: int
-   last_timer_update: float
 
    def __init__(self, memory: Memory, display: Display, input_: Input_):
        """
@@ -72,16 +67,43 @@ class CPU:
        self.memory = memory
        self.display = display
        self.input_ = input_
-       self.registers = [0] * REGISTER_COUNT
+       self.registers = array('B', bytes(REGISTER_COUNT))
        self.pc = ROM_START_IDX
-       self.pc_modified = False
        self.i = 0
-       self.stack = [0] * STACK_SIZE
+       self.stack = array('H', [0] * STACK_SIZE)
        self.sp = 0
        self.delay_timer = 0
        self.sound_timer = 0
-       self.last_timer_update = perf_counter()
        self.waiting_for_key = False
+       self._dispatch_table = (
+           self.dispatch_sys_control,     # 0nnn
+           self.jump,                     # 1nnn
+           self.call,                     # 2nnn
+           self.skip_eq_neq_nn,           # 3xkk
+           self.skip_eq_neq_nn,           # 4xkk
+           self.skip_eq_neq_reg,          # 5xy0
+           self.set_reg,                  # 6xkk
+           self.add_nn_no_carry,          # 7xkk
+           self.dispatch_reg_arithmetic,  # 8xyn
+           self.skip_eq_neq_reg,          # 9xy0
+           self.set_i,                    # Annn
+           self.jump,                     # Bnnn
+           self.set_random_byte,          # Cxkk
+           self.draw_sprite,              # Dxyn
+           self.process_input,            # Exkk
+           self.dispatch_misc_fx,         # Fxkk
+       )
+       self._misc_fx_table = {
+           0x07: self.get_delay_timer,
+           0x0A: self.wait_for_key_press,
+           0x15: self.set_delay_timer,
+           0x18: self.set_sound_timer,
+           0x1E: self.add_to_i,
+           0x29: self.set_i_to_sprite,
+           0x33: self.store_bcd,
+           0x55: self.store_registers,
+           0x65: self.load_registers,
+       }
 
    def cycle(self):
        """
@@ -89,73 +111,45 @@ class CPU:
        
        Performs the standard CPU cycle unless blocked waiting for input.
        Fetches 16-bit instruction from memory at PC, dispatches to appropriate
-       handler, and increments PC unless modified by jump/call instructions.
+       handler, and increments PC unless the handler reports that it set PC
+       itself (jump/call instructions return True).
        """
-       if not self.waiting_for_key:
-           self.opcode = self.memory.read_word(self.pc)
-           self.dispatch()
-           if not self.pc_modified:
-               self.pc += 2
-           self.pc_modified = False
-       else: 
-           self.waiting_for_key = not self.check_any_key_pressed()
-           
+       self.run(1)
 
-   def update_timers(self):
+   def run(self, cycles: int):
        """
-       Update delay and sound timers at 60Hz frequency.
+       Execute a batch of CPU cycles.
        
-       Decrements both timers if they are non-zero and sufficient time has
-       elapsed since last update. Maintains accurate 60Hz timing regardless
-       of CPU instruction frequency.
-       """
-       time_now = perf_counter()
-       if time_now - self.last_timer_update >= 1 / 60:
-           if self.delay_timer > 0:
-               self.delay_timer -= 1
-           if self.sound_timer > 0:
-               self.sound_timer -= 1
-           self.last_timer_update = time_now
-
+       Runs the same fetch-decode-execute step as cycle() in a tight loop,
+       with the memory fetch and handler table bound to locals so each
+       instruction avoids repeated attribute lookups. Timers, display and
+       input are left for the caller to reconcile once the batch is done.
+       
+       Args:
+           cycles: Number of cycles to execute
+       """
+       read_word = self.memory.read_word
+       dispatch_table = self._dispatch_table
+       for _ in range(cycles):
+           if self.waiting_for_key:
+               self.waiting_for_key = not self.check_any_key_pressed()
+               continue
+           self.opcode = opcode = read_word(self.pc)
+           if not dispatch_table[opcode >> 12]():
+               self.pc += 2
 
-   def dispatch(self):
+   def update_timers(self):
        """
-       Decode and dispatch instruction to appropriate handler.
+       Advance delay and sound timers by one 60Hz tick.
        
-       Top-level instruction categorization based on the first nibble.
-       Routes opcodes to specialized handlers or secondary dispatchers
-       for complete instruction set coverage.
-       
-       Raises:
-           UnsupportedOpcodeError: For unimplemented or invalid opcodes
+       Decrements both timers if they are non-zero. Meant to be called once
+       per emulated 60Hz frame; the caller's frame pacing sets the rate, so
+       the timers never drift against the frames that read them.
        """
-       match self.opcode & 0xF000:
-           case 0x0000:
-               self.dispatch_sys_control()
-           case 0x1000 | 0xB000:
-               self.jump()
-           case 0x2000:
-               self.call()
-           case 0x3000 | 0x4000 | 0x5000 | 0x9000:
-               self.dispatch_comparison()
-           case 0x6000:
-               self.set_reg()
-           case 0x7000:
-               self.add_nn_no_carry()
-           case 0x8000:
-               self.dispatch_reg_arithmetic()
-           case 0xA000:
-               self.set_i()
-           case 0xC000:
-               self.set_random_byte()
-           case 0xD000:
-               self.draw_sprite()
-           case 0xE000:
-               self.process_input()
-           case 0xF000:
-               self.dispatch_misc_fx()
-           case _:
-               raise UnsupportedOpcodeError(f"Code {self.opcode} not supported.")
+       if self.delay_timer > 0:
+           self.delay_timer -= 1
+       if self.sound_timer > 0:
+           self.sound_timer -= 1
 
    def _second_nibble(self):
        """
@@ -242,7 +236,7 @@ class CPU:
        1nnn: Jump to address nnn
        Bnnn: Jump to address nnn + V0 (jump with offset)
        
-       Sets pc_modified flag to prevent automatic PC increment.
+       Returns True to prevent automatic PC increment.
        """
        destination = self.opcode & 0x0FFF
        match self.opcode & 0xF000:
@@ -252,34 +246,20 @@ class CPU:
                self.pc = destination + self.registers[0]
            case _:
                raise UnsupportedOpcodeError(f"Code {self.opcode} not supported.")
-       self.pc_modified = True
+       return True
 
    def call(self):
        """
        Call subroutine at address nnn (2nnn).
        
        Pushes current PC to stack, increments stack pointer, and jumps
-       to subroutine address. Sets pc_modified to prevent auto-increment.
+       to subroutine address. Returns True to prevent auto-increment.
        """
        self.stack[self.sp] = self.pc
        self.sp += 1
        self.pc = self.opcode & 0x0FFF
-       self.pc_modified = True
+       return True
 
-   def dispatch_comparison(self):
-       """
-       Handle conditional skip instructions (3xxx, 4xxx, 5xxx, 9xxx).
-       
-       Routes to appropriate comparison handlers based on instruction format:
-       - 3xxx/4xxx: Compare register with immediate value
-       - 5xxx/9xxx: Compare register with register
-       """
-       match self.opcode & 0xF000:
-           case 0x3000 | 0x4000:
-               self.skip_eq_neq_nn()
-           case 0x5000 | 0x9000:
-               self.skip_eq_neq_reg()
-   
    def skip_eq_neq_nn(self):
        """
        Skip instructions based on register-immediate comparison.
@@ -451,15 +431,14 @@ class CPU:
        """
        Draw sprite to display with collision detection (Dxyn).
        
-       Reads n bytes from memory starting at I, draws 8xn sprite at
-       coordinates (Vx, Vy) using XOR logic. Sets VF to 1 if any
-       pixels were erased (collision), 0 otherwise.
+       Reads n bytes from memory starting at I in one block read, draws
+       8xn sprite at coordinates (Vx, Vy) using XOR logic. Sets VF to 1
+       if any pixels were erased (collision), 0 otherwise.
        """
        x = self.registers[self._second_nibble()]
        y = self.registers[self._third_nibble()]
-       size = self._fourth_nibble()
-       byte_array = [self.memory.read_byte(self.i + j) for j in range(size)]
-       collision = self.display.draw_sprite(x, y, byte_array)
+       sprite = self.memory.read_bytes(self.i, self._fourth_nibble())
+       collision = self.display.draw_sprite(x, y, sprite)
        self.registers[VF_IDX] = collision
 
    def process_input(self):
@@ -469,14 +448,14 @@ class CPU:
        Ex9E: Skip next instruction if key Vx is pressed
        ExA1: Skip next instruction if key Vx is not pressed
        
-       Advances PC by additional 2 bytes when condition is met.
+       Advances PC by additional 2 bytes when condition is met. Both forms
+       query the key once and XOR the result with the ExA1 inversion.
        """
-       key = self.registers[self._second_nibble()]
        low_byte = self._second_byte()
-       if (
-           (low_byte == 0x9E and self.input_.key_pressed(key)) or
-           (low_byte == 0xA1 and self.input_.key_not_pressed(key))
-       ):
+       if low_byte != 0x9E and low_byte != 0xA1:
+           return
+       key = self.registers[self._second_nibble()]
+       if self.input_.key_pressed(key) ^ (low_byte == 0xA1):
            self.pc += 2
 
    def dispatch_misc_fx(self):
@@ -484,34 +463,68 @@ class CPU:
        Handle miscellaneous Fx instructions.
        
        Processes timer operations, memory operations, BCD conversion,
-       register dumps/loads, and font sprite addressing.
+       register dumps/loads, and font sprite addressing. The low byte is
+       looked up in a handler table built at init.
        
        Raises:
            UnsupportedOpcodeError: For unrecognized Fx instructions
        """
-       reg_idx = self._second_nibble()
-       match self.opcode & 0x00FF:
-           case 0x0007:
-               self.registers[reg_idx] = self.delay_timer
-           case 0x000A:
-               self.input_.start_waiting()
-               self.waiting_for_key = True
-           case 0x0015:
-               self.delay_timer = self.registers[reg_idx]
-           case 0x0018:
-               self.sound_timer = self.registers[reg_idx]
-           case 0x001E:
-               self.i += self.registers[reg_idx]
-           case 0x0029:
-               self.i = self.memory.get_sprite_address(self.registers[reg_idx])
-           case 0x0033:
-               self.store_bcd()
-           case 0x0055:
-               self.exchange_regs_memory(write=True)
-           case 0x0065:
-               self.exchange_regs_memory(write=False)
-           case _:
-               raise UnsupportedOpcodeError(f"Code {self.opcode} not supported.")
+       handler = self._misc_fx_table.get(self.opcode & 0x00FF)
+       if handler is None:
+           raise UnsupportedOpcodeError(f"Code {self.opcode} not supported.")
+       handler()
+
+   def get_delay_timer(self):
+       """
+       Set Vx to the delay timer value (Fx07).
+       """
+       self.registers[self._second_nibble()] = self.delay_timer
+
+   def wait_for_key_press(self):
+       """
+       Block execution until a key is pressed (Fx0A).
+       
+       Captures the current key states and puts the CPU into the waiting
+       state; the pressed key is stored by check_any_key_pressed().
+       """
+       self.input_.start_waiting()
+       self.waiting_for_key = True
+
+   def set_delay_timer(self):
+       """
+       Set the delay timer to Vx (Fx15).
+       """
+       self.delay_timer = self.registers[self._second_nibble()]
+
+   def set_sound_timer(self):
+       """
+       Set the sound timer to Vx (Fx18).
+       """
+       self.sound_timer = self.registers[self._second_nibble()]
+
+   def add_to_i(self):
+       """
+       Add Vx to the index register I (Fx1E).
+       """
+       self.i += self.registers[self._second_nibble()]
+
+   def set_i_to_sprite(self):
+       """
+       Set I to the location of the font sprite for digit Vx (Fx29).
+       """
+       self.i = self.memory.get_sprite_address(self.registers[self._second_nibble()])
+
+   def store_registers(self):
+       """
+       Store registers V0-Vx to memory starting at I (Fx55).
+       """
+       self.exchange_regs_memory(write=True)
+
+   def load_registers(self):
+       """
+       Load registers V0-Vx from memory starting at I (Fx65).
+       """
+       self.exchange_regs_memory(write=False)
 
    def check_any_key_pressed(self) -> bool:
        """
@@ -554,9 +567,8 @@ class CPU:
        Args:
            write: True for store operation, False for load operation
        """
-       reg_idx = self._second_nibble()
-       for idx in range(reg_idx + 1):
-           if write:
-               self.memory.write_byte(self.i + idx, self.registers[idx])
-           else:
-               self.registers[idx] = self.memory.read_byte(self.i + idx)
\ No newline at end of file
+       count = self._second_nibble() + 1
+       if write:
+           self.memory.write_bytes(self.i, self.registers[:count])
+       else:
+           self.registers[:count] = array('B', self.memory.read_bytes(self.i, count))
\ No newline at end of file
@@ -1,7 +1,34 @@
 import os
 import sys
 
-from typing import List
+from functools import cache
+from typing import List, Sequence
+
+
+_ROW_MASK = (1 << 64) - 1
+_BLANK_SCREEN = (0,) * 32
+# Wrapped row indices for a sprite starting at each y: _ROWS_FROM[y][i] == (y + i) % 32
+_ROWS_FROM = tuple(tuple((y + i) & 31 for i in range(32)) for y in range(32))
+# Rendered text for 8 pixels of a row, indexed by their byte value
+_GLYPH_LUT = tuple(
+    "".join("██" if byte >> (7 - i) & 1 else "  " for i in range(8))
+    for byte in range(256)
+)
+_ROW_SHIFTS = (56, 48, 40, 32, 24, 16, 8, 0)
+# Changed pixels above which a row is rewritten whole instead of per pixel
+_FULL_ROW_THRESHOLD = 12
+
+
+@cache
+def _row_word(byte: int, x: int) -> int:
+    """
+    Shift a sprite byte into a 64-bit row word starting at column x.
+    
+    Bits that fall off the right edge wrap around to the left. Results are
+    memoized; the key space is bounded by 256 bytes x 64 columns.
+    """
+    return (byte << 56 >> x) | (byte << (120 - x) & _ROW_MASK)
+
 
 class Display:
     """
@@ -11,12 +38,16 @@ class Display:
     Provides terminal-based rendering using ANSI escape sequences for 
     real-time emulation output.
     
+    Each row of the screen is packed into a single 64-bit integer, with
+    bit 63 holding column 0 and bit 0 holding column 63. This lets a whole
+    sprite row be XORed and collision-checked with one integer operation.
+    
     Attributes:
-        screen: Current 64x32 pixel state (True = on, False = off)
+        screen: Current 32 rows of 64 packed pixels (1 = on, 0 = off)
         prev_screen: Previous frame state for differential rendering
     """
-    screen: List[List[bool]]
-    prev_screen: List[List[bool]]
+    screen: List[int]
+    prev_screen: List[int]
     
     def __init__(self):
         """
@@ -25,46 +56,64 @@ class Display:
         Sets up screen buffers, enables ANSI escape sequences on Windows,
         and clears the terminal for rendering.
         """
-        self.screen = [[False] * 64 for _ in range(32)]
-        self.prev_screen = [[False] * 64 for _ in range(32)]
+        self.screen = list(_BLANK_SCREEN)
+        self.prev_screen = list(_BLANK_SCREEN)
         if sys.platform == "win32":
             os.system('')
         print("\033[2J\033[H", end="")
 
+    def pixel(self, x: int, y: int) -> bool:
+        """
+        Get the state of a single pixel.
+        
+        Args:
+            x: X coordinate (0-63)
+            y: Y coordinate (0-31)
+            
+        Returns:
+            bool: True if the pixel is on, False otherwise
+        """
+        return bool(self.screen[y] >> (63 - x) & 1)
+
     def clear_screen(self):
         """
         Clear all pixels on the display.
         
-        Sets all pixels to False (off state). Used by the CLS instruction (00E0).
+        Sets all pixels to off. Used by the CLS instruction (00E0).
         """
-        self.screen = [[False] * 64 for _ in range(32)]
+        self.screen[:] = _BLANK_SCREEN
 
-    def draw_sprite(self, x0: int, y0: int, byte_array: List[int]) -> bool:
+    def draw_sprite(self, x0: int, y0: int, byte_array: Sequence[int]) -> bool:
         """
         Draw sprite at specified coordinates using XOR logic.
         
         Args:
             x0: Starting X coordinate (wraps at 64)
             y0: Starting Y coordinate (wraps at 32) 
-            byte_array: Sprite data as list of bytes (each byte = 8 pixels wide)
+            byte_array: Sprite data as bytes or a list of byte values (each byte = 8 pixels wide)
             
         Returns:
             bool: True if any pixels were erased (collision detected), False otherwise
             
         Note:
             Uses XOR logic: existing pixels are flipped when sprite pixels are 1.
-            Coordinates wrap around screen edges automatically.
+            Coordinates wrap around screen edges automatically. Each sprite
+            byte is shifted into place as a 64-bit row word (cached per byte
+            and column), rotating the bits that fall off the right edge back
+            to the left. Wrapping uses bitmasks (the screen dimensions are
+            powers of two) and the wrapped row indices come from a
+            precomputed table.
         """
-        collided = False
-        for i in range(len(byte_array)):
-            for j in range(len(bytes_str := format(byte_array[i], "08b"))):
-                x = (x0 + j) % 64
-                y = (y0 + i) % 32
-                if self.screen[y][x] and int(bytes_str[j]):
-                    collided = True
-                self.screen[y][x] ^= True if bytes_str[j] == "1" else False
+        screen = self.screen
+        x0 &= 63
+        collided = 0
+        for byte, y in zip(byte_array, _ROWS_FROM[y0 & 31]):
+            word = _row_word(byte, x0)
+            row = screen[y]
+            collided |= row & word
+            screen[y] = row ^ word
 
-        return collided
+        return collided != 0
     
     def refresh(self):
         """
@@ -72,17 +121,37 @@ class Display:
         
         Performs differential rendering by comparing current screen with 
         previous frame. Only redraws pixels that changed state, improving
-        performance. Updates prev_screen to match current state.
+        performance. Rows that are equal to the previous frame are skipped
+        with a single integer comparison, and within a dirty row only the
+        set bits of the XOR difference are visited, so the cost scales with
+        the number of changed pixels. Rows with many changed pixels (e.g.
+        after a clear) are instead rendered whole from a byte-to-glyph
+        table behind a single cursor move. All cursor moves and glyphs for the
+        frame are joined into one buffer and written with a single call.
+        An unchanged frame is detected with one list comparison and returns
+        after the final flush without visiting any rows.
+        Updates prev_screen to match current state.
         """
-        for i in range(len(self.screen)):
-            for j in range(len(self.screen[0])):
-                if self.screen[i][j] != self.prev_screen[i][j]:
-                    print(f"\033[{i+1};{j*2+1}H", end="")
-                    if self.screen[i][j]:
-                        print("██", end="")
-                    else:
-                        print("  ", end="")
-        self.prev_screen = [row[:] for row in self.screen]
+        if self.screen == self.prev_screen:
+            print("", end="", flush=True)
+            return
+        parts = []
+        for i, (row, prev_row) in enumerate(zip(self.screen, self.prev_screen)):
+            if row == prev_row:
+                continue
+            diff = row ^ prev_row
+            if diff.bit_count() > _FULL_ROW_THRESHOLD:
+                parts.append(f"\033[{i+1};1H")
+                parts.extend(_GLYPH_LUT[row >> shift & 0xFF] for shift in _ROW_SHIFTS)
+                continue
+            while diff:
+                bit = (diff & -diff).bit_length() - 1
+                diff &= diff - 1
+                glyph = "██" if row >> bit & 1 else "  "
+                parts.append(f"\033[{i+1};{(63-bit)*2+1}H{glyph}")
+        if parts:
+            sys.stdout.write("".join(parts))
+        self.prev_screen[:] = self.screen
         print("", end="", flush=True)
     
     
@@ -1,4 +1,4 @@
-from time import sleep
+from time import perf_counter, sleep
 from typing import Optional
 
 from core.cpu import CPU
@@ -19,9 +19,9 @@ class Emulator:
    Architecture:
    The emulator follows a precise timing model:
    - CPU runs at TARGET_IPS (instructions per second)
-   - Display refreshes at 60Hz (every TARGET_IPS/60 CPU cycles)
-   - Timers update at 60Hz synchronized with display refresh
-   - Sleep timing maintains consistent instruction rate
+   - Each 60Hz frame executes a batch of TARGET_IPS/60 CPU cycles
+   - Display refreshes and timers update once per frame, after the batch
+   - Sleep timing after each batch maintains consistent instruction rate
    
    This timing separation allows the CPU to run faster than 60Hz while
    maintaining proper display and timer frequencies for authentic CHIP-8 behavior.
@@ -31,16 +31,14 @@ class Emulator:
        input_: Keyboard input handler for user interaction
        memory: Memory management system with ROM and fontset
        display: Graphics display with terminal rendering
-       delay_between_ops: Sleep duration to maintain TARGET_IPS timing
-       cpu_cycles: Current cycle count since last 60Hz update
-       cpu_cycles_max: Cycles per 60Hz period (TARGET_IPS / 60)
+       frame_delay: Length of one 60Hz frame in seconds (1/60)
+       cpu_cycles_max: Cycles per 60Hz frame (TARGET_IPS / 60, rounded)
    """
    cpu: CPU
    input_: Input_
    memory: Memory
    display: Display
-   delay_between_ops: float
-   cpu_cycles: int
+   frame_delay: float
    cpu_cycles_max: int
 
    def __init__(self, game: Optional[str]):
@@ -65,33 +63,36 @@ class Emulator:
            self.memory.load_game(game)
        self.display = Display()
        self.cpu = CPU(self.memory, self.display, self.input_)
-       self.delay_between_ops = 1.0 / TARGET_IPS
-       self.cpu_cycles = 0
-       self.cpu_cycles_max = TARGET_IPS // 60
+       self.frame_delay = 1 / 60
+       self.cpu_cycles_max = round(TARGET_IPS * self.frame_delay)
        
 
    def emulate(self):
        """
        Run the main emulation loop indefinitely.
        
-       Executes the core emulation cycle:
-       1. Execute one CPU instruction
-       2. Sleep to maintain TARGET_IPS timing
-       3. Track cycles for 60Hz synchronization  
-       4. Every cpu_cycles_max cycles (60Hz):
-          - Refresh display with latest graphics
-          - Update delay and sound timers
-          - Reset cycle counter
+       Executes the core emulation cycle once per 60Hz frame:
+       1. Poll the keyboard once for the frame
+       2. Execute a batch of cpu_cycles_max CPU instructions
+       3. Sleep until the frame's deadline to maintain TARGET_IPS timing
+       4. Refresh display with latest graphics
+       5. Update delay and sound timers
        
        The loop runs until manually interrupted (Ctrl+C) or system exit.
-       Timing precision ensures authentic CHIP-8 behavior regardless of
-       host system performance.
+       Frames are paced against a monotonic deadline that advances by
+       frame_delay each frame, so time spent emulating and sleep overshoot
+       are absorbed instead of accumulating as drift. If the host falls
+       behind, the deadline is reset rather than bursting to catch up.
        """
+       deadline = perf_counter()
        while True:
-           self.cpu.cycle()
-           sleep(self.delay_between_ops)
-           self.cpu_cycles += 1
-           if self.cpu_cycles >= self.cpu_cycles_max:
-               self.cpu_cycles = 0
-               self.display.refresh()
-               self.cpu.update_timers()
\ No newline at end of file
+           self.input_.poll()
+           self.cpu.run(self.cpu_cycles_max)
+           deadline += self.frame_delay
+           remaining = deadline - perf_counter()
+           if remaining > 0:
+               sleep(remaining)
+           else:
+               deadline = perf_counter()
+           self.display.refresh()
+           self.cpu.update_timers()
\ No newline at end of file
@@ -1,8 +1,78 @@
+import ctypes
 from time import sleep
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Tuple, Union
 
 import keyboard
 
+
+# QWERTY key for each CHIP-8 key, indexed by key code (0x0-0xF)
+_QWERTY: Tuple[str, ...] = (
+    "x", "1", "2", "3",  # 0 1 2 3
+    "q", "w", "e", "a",  # 4 5 6 7
+    "s", "d", "z", "c",  # 8 9 A B
+    "4", "r", "f", "v",  # C D E F
+)
+# Built once at import from _QWERTY; every Input_ shares these read-only mappings
+_CHIP8_TO_QWERTY: Mapping[int, str] = MappingProxyType(dict(enumerate(_QWERTY)))
+_QWERTY_TO_CHIP8: Mapping[str, int] = MappingProxyType(
+    {k: v for v, k in enumerate(_QWERTY)}
+)
+# State bit for each CHIP-8 key, indexed by key code
+_KEY_BITS: Tuple[int, ...] = tuple(1 << k for k in range(0x10))
+# Windows virtual-key codes for digit and letter keys equal their uppercase ASCII
+_VIRTUAL_KEYS: Tuple[int, ...] = tuple(ord(k.upper()) for k in _QWERTY)
+
+# Per-key query used when no snapshot is available; module-level so it can be swapped
+_is_pressed = keyboard.is_pressed
+
+# Native key-state query on Windows; None elsewhere, falling back to keyboard
+try:
+    _get_async_key_state = ctypes.windll.user32.GetAsyncKeyState
+except AttributeError:
+    _get_async_key_state = None
+
+# Scan codes per CHIP-8 key (or the key names as a fallback), resolved on first use
+_key_codes: Optional[Tuple[Union[FrozenSet[int], str], ...]] = None
+
+
+def _resolve_key_codes() -> Tuple[Union[FrozenSet[int], str], ...]:
+    """
+    Resolve and cache the scan codes for each CHIP-8 key.
+    
+    Scan codes take the keyboard library's fast path (a set lookup) instead
+    of re-parsing the key name on every call. Every scan code of a key is
+    kept, since some backends map one name to several physical keys (e.g.
+    a digit on both the main row and the keypad). If the platform backend
+    cannot map names to scan codes, the names themselves are cached.
+    """
+    global _key_codes
+    try:
+        _key_codes = tuple(frozenset(keyboard.key_to_scan_codes(k)) for k in _QWERTY)
+    except (ImportError, OSError, ValueError):
+        _key_codes = _QWERTY
+    return _key_codes
+
+
+def _pressed_scan_codes() -> Optional[frozenset]:
+    """
+    Snapshot the scan codes the keyboard library currently sees as pressed.
+    
+    Reads the library's pressed-event table once under its lock, instead of
+    taking the lock in a separate is_pressed call per key. Returns None if
+    those internals are not available in the installed keyboard version.
+    """
+    try:
+        listener = keyboard._listener
+        lock = keyboard._pressed_events_lock
+        pressed_events = keyboard._pressed_events
+    except AttributeError:
+        return None
+    listener.start_if_necessary()
+    with lock:
+        return frozenset(pressed_events)
+
+
 class Input_: 
     """
    CHIP-8 Input Handler
@@ -25,23 +95,40 @@ class Input_:
    Attributes:
        qwerty_to_chip8: Maps QWERTY key strings to CHIP-8 hex values (0x0-0xF)
        chip8_to_qwerty: Reverse mapping from CHIP-8 hex values to QWERTY keys
-       last_key_states: Previous frame key states for change detection
+       last_key_states: Previous key states for change detection, as a
+           bitmask with bit k set while CHIP-8 key k is pressed
+       frame_key_states: Key states captured by the last poll(), in the
+           same bitmask form
    """
-    qwerty_to_chip8: Dict[str, int]
-    chip8_to_qwerty: Dict[int, str]
+    __slots__ = (
+        "qwerty_to_chip8", "chip8_to_qwerty", "last_key_states",
+        "frame_key_states"
+    )
+
+    qwerty_to_chip8: Mapping[str, int]
+    chip8_to_qwerty: Mapping[int, str]
+    last_key_states: int
+    frame_key_states: int
 
     def __init__(self):
-        self.qwerty_to_chip8 = {
-            "1": 0x1, "2": 0x2, "3": 0x3, "4": 0xC,
-            "q": 0x4, "w": 0x5, "e": 0x6, "r": 0xD,
-            "a": 0x7, "s": 0x8, "d": 0x9, "f": 0xE,
-            "z": 0xA, "x": 0x0, "c": 0xB, "v": 0xF
-        }
-        self.chip8_to_qwerty = {v: k for k, v in self.qwerty_to_chip8.items()}
+        self.qwerty_to_chip8 = _QWERTY_TO_CHIP8
+        self.chip8_to_qwerty = _CHIP8_TO_QWERTY
+        self.last_key_states = 0
+        self.frame_key_states = 0
+
+    def poll(self):
+        """
+       Capture the state of all 16 keys for the current frame.
+       
+       Called once per frame by the emulator; key_pressed() and
+       key_not_pressed() answer from this snapshot, so any number of
+       Ex9E/ExA1 instructions in a frame cost one poll in total.
+       """
+        self.frame_key_states = self._key_states()
 
     def key_pressed(self, key: int) -> bool:
         """
-       Check if a CHIP-8 key is currently pressed.
+       Check if a CHIP-8 key was pressed at the last poll().
        
        Used for immediate key state queries (e.g., skip instructions Ex9E/ExA1).
        
@@ -49,12 +136,14 @@ class Input_:
            key: CHIP-8 key code (0x0-0xF)
            
        Returns:
-           True if the key is currently pressed, False otherwise
+           True if the key was pressed in the current frame, False otherwise
            
        Raises:
            KeyError: If key is not in valid range (0x0-0xF)
        """
-        return keyboard.is_pressed(self.chip8_to_qwerty[key])
+        if not 0 <= key <= 0xF:
+            raise KeyError(key)
+        return bool(self.frame_key_states >> key & 1)
 
     def key_not_pressed(self, key: int) -> bool:
         """
@@ -74,48 +163,76 @@ class Input_:
         """
        Begin waiting for key press events.
        
-       Captures current key states as baseline for detecting new key presses.
+       Takes the current frame's key states (from poll()) as baseline for
+       detecting new key presses, without polling the keyboard again.
        Must be called before using check_keystates_changed(). Used by the
        Fx0A instruction to wait for user input.
        """
-        self.last_key_states = self._key_states()
+        self.last_key_states = self.frame_key_states
         
     def check_keystates_changed(self) -> Optional[int]:
         """
        Detect newly pressed keys since start_waiting() was called.
        
-       Compares current key states with the baseline captured by start_waiting().
-       Returns the first key that transitioned from not-pressed to pressed.
-       Updates internal state to prevent duplicate detection.
+       Compares the current frame's key states (from poll()) with the
+       baseline captured by start_waiting(). Returns the lowest key that
+       transitioned from not-pressed to pressed, found with a single mask
+       operation on the packed states. Updates internal state to prevent
+       duplicate detection.
        
        Returns:
            CHIP-8 key code (0x0-0xF) of newly pressed key, or None if no new presses
            
        Note:
            Only detects key press events (down transitions), not releases.
-           Call start_waiting() first to establish baseline state.
+           Call start_waiting() first to establish baseline state. The
+           keyboard is only read by poll(), so checking repeatedly while
+           waiting costs no extra polls.
        """
-        curr_key_states = self._key_states()
-        for idx in range(len(curr_key_states)):
-            if curr_key_states[idx] and not self.last_key_states[idx]:
-                self.last_key_states = curr_key_states
-                return idx
+        curr_key_states = self.frame_key_states
+        if curr_key_states == self.last_key_states:
+            return None
+        newly_pressed = curr_key_states & ~self.last_key_states
         self.last_key_states = curr_key_states
-        return None
+        if not newly_pressed:
+            return None
+        return (newly_pressed & -newly_pressed).bit_length() - 1
 
-    def _key_states(self) -> List[bool]:
+    def _key_states(self) -> int:
         """
        Get current state of all 16 CHIP-8 keys.
        
-       Internal helper method that polls all mapped keys and returns their
-       current pressed/released states.
+       Internal helper method that polls all mapped keys and packs their
+       current pressed/released states into one integer. On Windows the
+       states are read directly with GetAsyncKeyState, bypassing the
+       keyboard library's event tracking and lock. Elsewhere, when keys
+       resolved to scan codes, one snapshot of the library's pressed set
+       is checked for all keys, a key counting as pressed if any of its
+       scan codes is; otherwise each key is polled with keyboard.is_pressed.
        
        Returns:
-           List of 16 boolean values, indexed by CHIP-8 key code (0x0-0xF).
-           True indicates the key is currently pressed.
+           16-bit mask where bit k is set if CHIP-8 key k (0x0-0xF) is
+           currently pressed.
        """
-        key_states = [False] * 16
-        for k in self.chip8_to_qwerty.keys():
-            if self.key_pressed(k):
-                key_states[k] = True
+        key_states = 0
+        if _get_async_key_state is not None:
+            for bit, vk in zip(_KEY_BITS, _VIRTUAL_KEYS):
+                if _get_async_key_state(vk) & 0x8000:
+                    key_states |= bit
+            return key_states
+        key_codes = _key_codes or _resolve_key_codes()
+        if key_codes is _QWERTY:
+            for bit, name in zip(_KEY_BITS, key_codes):
+                if _is_pressed(name):
+                    key_states |= bit
+            return key_states
+        pressed = _pressed_scan_codes()
+        if pressed is not None:
+            for bit, codes in zip(_KEY_BITS, key_codes):
+                if not codes.isdisjoint(pressed):
+                    key_states |= bit
+            return key_states
+        for bit, codes in zip(_KEY_BITS, key_codes):
+            if any(_is_pressed(code) for code in codes):
+                key_states |= bit
         return key_states
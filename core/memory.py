@@ -1,4 +1,4 @@
-from typing import List
+from struct import Struct, error as StructError
 
 from core.errors import MemoryOutOfBoundsError, ByteOverflowError
 from configs import (
@@ -8,6 +8,16 @@ from configs import (
     FONTSET
 )
 
+# Big-endian 16-bit word reader; raises struct.error past the end of the buffer
+_unpack_word = Struct(">H").unpack_from
+# Start address of each 5-byte character sprite, indexed by hex digit
+_SPRITE_ADDRESSES = tuple(FONTSET_START_ADDRESS + 5 * digit for digit in range(0x10))
+# Fontset frozen once at import, with the end of its memory region
+_FONTSET_BYTES = bytes(FONTSET)
+_FONTSET_END = FONTSET_START_ADDRESS + len(_FONTSET_BYTES)
+# Zeroed image copied over memory on reset
+_BLANK_MEMORY = bytes(MEMORY_SIZE_IN_BYTES)
+
 
 class Memory:
     """
@@ -35,11 +45,22 @@ class Memory:
        rom_loaded: Flag indicating whether a ROM has been loaded
    """
 
-    _memory: List[int]
+    _memory: bytearray
     rom_loaded: bool
 
     def __init__(self):
-        self._memory = [0] * MEMORY_SIZE_IN_BYTES
+        self._memory = bytearray(MEMORY_SIZE_IN_BYTES)
+        self.reset()
+
+    def reset(self):
+        """
+       Restore memory to its power-on state.
+       
+       Clears all 4KB in place, reloads the fontset and allows a new ROM
+       to be loaded. The underlying byte array is reused rather than
+       reallocated.
+       """
+        self._memory[:] = _BLANK_MEMORY
         self._load_fontset()
         self.rom_loaded = False
 
@@ -48,8 +69,10 @@ class Memory:
        Load ROM file into memory starting at address 0x200.
        
        Reads binary ROM data and places it in the program area without
-       overwriting the fontset region. Prevents multiple ROM loads to
-       maintain system state integrity.
+       overwriting the fontset region. The file is read straight into
+       memory through a view of the program area, so no intermediate
+       buffer is created and bytes beyond the end of memory are ignored.
+       Prevents multiple ROM loads to maintain system state integrity.
        
        Args:
            file_path: Path to the CHIP-8 ROM file (.ch8 format)
@@ -60,10 +83,8 @@ class Memory:
        """
         if self.rom_loaded:
             return
-        with open(file_path, "rb") as f:
-            byte_array = bytearray(f.read())
-        end_idx = ROM_START_IDX + len(byte_array)
-        self._memory[ROM_START_IDX:end_idx] = byte_array
+        with open(file_path, "rb") as f, memoryview(self._memory) as view:
+            f.readinto(view[ROM_START_IDX:])
         self.rom_loaded = True
 
     def load_game(self, game: str):
@@ -89,12 +110,10 @@ class Memory:
        5-byte sprite data for hexadecimal characters 0-F. Each character
        occupies exactly 5 consecutive bytes representing an 8x5 pixel sprite.
        
-       Called automatically during Memory initialization.
+       Called automatically during Memory initialization. The whole fontset
+       is copied from the import-time bytes with one slice assignment.
        """
-        for digit in range(0x10):
-            for byte_idx in range(5):
-                memory_idx = FONTSET_START_ADDRESS + 5 * digit + byte_idx
-                self._memory[memory_idx] = FONTSET[5 * digit + byte_idx]
+        self._memory[FONTSET_START_ADDRESS:_FONTSET_END] = _FONTSET_BYTES
 
     def read_byte(self, addr: int) -> int:
         """
@@ -109,9 +128,10 @@ class Memory:
        Raises:
            MemoryOutOfBoundsError: If address exceeds memory bounds
        """
-        if addr >= MEMORY_SIZE_IN_BYTES:
-            raise MemoryOutOfBoundsError("Memory access out of bounds")
-        return self._memory[addr]
+        try:
+            return self._memory[addr]
+        except IndexError:
+            raise MemoryOutOfBoundsError("Memory access out of bounds") from None
 
     def read_word(self, addr: int) -> int:
         """
@@ -119,6 +139,8 @@ class Memory:
        
        Combines two consecutive bytes into a single 16-bit value. The byte
        at 'addr' becomes the high byte, and 'addr+1' becomes the low byte.
+       Both bytes are decoded by one struct call, whose own range check
+       doubles as the bounds check.
        
        Args:
            addr: Starting memory address (0x000-0xFFE)
@@ -133,9 +155,10 @@ class Memory:
            Memory[0x200] = 0x12, Memory[0x201] = 0x34
            read_word(0x200) returns 0x1234
        """
-        if addr + 2 > MEMORY_SIZE_IN_BYTES:
-            raise MemoryOutOfBoundsError("Memory access out of bounds")
-        return self._memory[addr] << 8 | self._memory[addr + 1]
+        try:
+            return _unpack_word(self._memory, addr)[0]
+        except StructError:
+            raise MemoryOutOfBoundsError("Memory access out of bounds") from None
 
     def write_byte(self, addr: int, value: int):
         """
@@ -149,11 +172,54 @@ class Memory:
            MemoryOutOfBoundsError: If address exceeds memory bounds
            ByteOverflowError: If value exceeds byte range (0-255)
        """
-        if addr >= MEMORY_SIZE_IN_BYTES:
+        try:
+            self._memory[addr] = value
+        except IndexError:
+            raise MemoryOutOfBoundsError("Memory access out of bounds") from None
+        except ValueError:
+            raise ByteOverflowError("Given value larger than 1 byte") from None
+
+    def read_bytes(self, addr: int, count: int) -> bytes:
+        """
+       Read a contiguous block of bytes from memory.
+       
+       Copies the whole range in a single slice instead of one read_byte
+       call per address.
+       
+       Args:
+           addr: Starting memory address
+           count: Number of bytes to read
+           
+       Returns:
+           Bytes stored at addresses addr..addr+count-1
+           
+       Raises:
+           MemoryOutOfBoundsError: If the range exceeds memory bounds
+       """
+        if addr + count > MEMORY_SIZE_IN_BYTES:
+            raise MemoryOutOfBoundsError("Memory access out of bounds")
+        return bytes(self._memory[addr:addr + count])
+
+    def write_bytes(self, addr: int, values):
+        """
+       Write a contiguous block of bytes to memory.
+       
+       Args:
+           addr: Starting memory address
+           values: Iterable of byte values (0-255), e.g. bytes or array('B')
+           
+       Raises:
+           MemoryOutOfBoundsError: If the range exceeds memory bounds
+           ByteOverflowError: If any value exceeds byte range (0-255)
+       """
+        try:
+            data = bytes(values)
+        except ValueError:
+            raise ByteOverflowError("Given value larger than 1 byte") from None
+        end_idx = addr + len(data)
+        if end_idx > MEMORY_SIZE_IN_BYTES:
             raise MemoryOutOfBoundsError("Memory access out of bounds")
-        if value > 255 or value < 0:
-            raise ByteOverflowError("Given value larger than 1 byte")
-        self._memory[addr] = value
+        self._memory[addr:end_idx] = data
 
     def get_sprite_address(self, digit: int) -> int:
         """
@@ -164,7 +230,7 @@ class Memory:
        set the I register to point to character sprites.
        
        Args:
-           digit: Hexadecimal digit (0x0-0xF)
+           digit: Hexadecimal digit (0x0-0xF); only the low nibble is used
            
        Returns:
            Memory address of the sprite's first byte
@@ -173,4 +239,4 @@ class Memory:
            get_sprite_address(0x0) returns address of '0' character sprite
            get_sprite_address(0xA) returns address of 'A' character sprite
        """
-        return FONTSET_START_ADDRESS + 5 * digit        
+        return _SPRITE_ADDRESSES[digit & 0xF]
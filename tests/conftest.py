@@ -0,0 +1,19 @@
+import pytest
+
+import core.input_
+from fakes import FakeIsPressed
+
+
+@pytest.fixture(autouse=True)
+def keyboard_backend(monkeypatch):
+    """Route key polling through _is_pressed by key name so tests can swap it."""
+    monkeypatch.setattr(core.input_, "_get_async_key_state", None)
+    monkeypatch.setattr(core.input_, "_key_codes", core.input_._QWERTY)
+
+
+@pytest.fixture
+def fake_pressed(monkeypatch):
+    """Replace the keyboard query with a FakeIsPressed (no keys pressed by default)."""
+    fake = FakeIsPressed()
+    monkeypatch.setattr(core.input_, "_is_pressed", fake)
+    return fake
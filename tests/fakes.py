@@ -0,0 +1,67 @@
+"""
+Lightweight test doubles for CHIP-8 components.
+
+Plain classes with ordinary methods, used instead of Mock(spec=...) on
+paths that execute many cycles, where Mock's attribute machinery would
+dominate the measured cost.
+"""
+
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+
+class FakeMemory:
+    """
+    Memory stand-in serving preset opcodes and a block of data bytes.
+
+    Attributes:
+        calls: Recorded (method name, address) pairs, in call order
+    """
+
+    calls: List[Tuple[str, int]]
+
+    def __init__(self, words: Iterable[int], data: Sequence[int] = (), base: int = 0):
+        """
+        Args:
+            words: Opcodes returned by successive read_word calls
+            data: Byte values readable at addresses base..base+len(data)-1
+            base: Address of the first data byte
+        """
+        self._words = iter(words)
+        self._data = list(data)
+        self._base = base
+        self.calls = []
+
+    def read_word(self, addr: int) -> int:
+        self.calls.append(("read_word", addr))
+        return next(self._words)
+
+    def read_bytes(self, addr: int, count: int) -> bytes:
+        self.calls.append(("read_bytes", addr))
+        start = addr - self._base
+        return bytes(self._data[start:start + count])
+
+
+class FakeIsPressed:
+    """
+    Stand-in for keyboard.is_pressed.
+
+    Answers with side_effect(key) when set, otherwise return_value.
+
+    Attributes:
+        calls: Keys queried, in call order
+    """
+
+    return_value: bool
+    side_effect: Optional[Callable[[object], bool]]
+    calls: List[object]
+
+    def __init__(self):
+        self.return_value = False
+        self.side_effect = None
+        self.calls = []
+
+    def __call__(self, key) -> bool:
+        self.calls.append(key)
+        if self.side_effect is not None:
+            return self.side_effect(key)
+        return self.return_value
@@ -3,6 +3,10 @@ Comprehensive CPU Tests for CHIP-8 Emulator
 
 Tests all CPU instructions, state management, and edge cases.
 Organized by instruction categories matching the CPU's dispatch structure.
+
+PYTEST_DONT_REWRITE: the opcode tests are dozens of trivial register
+comparisons, so this module runs with plain asserts to skip pytest's
+assertion rewriting.
 """
 
 import pytest
@@ -14,7 +18,12 @@ from core.memory import Memory
 from core.display import Display
 from core.input_ import Input_
 from core.errors import UnsupportedOpcodeError
-from configs import ROM_START_IDX, REGISTER_COUNT, STACK_SIZE, VF_IDX
+from configs import ROM_START_IDX, REGISTER_COUNT, STACK_SIZE, VF_IDX, TARGET_IPS
+from fakes import FakeMemory
+
+# Throughput floor for the cycle benchmark: a frame's worth of
+# instructions must take well under a frame to execute.
+MIN_BENCHMARK_IPS = 20 * TARGET_IPS
 
 
 class TestCPUInitialization:
@@ -26,14 +35,13 @@ class TestCPUInitialization:
         
         cpu = CPU(memory, display, input_)
         
-        assert cpu.registers == [0] * REGISTER_COUNT
+        assert list(cpu.registers) == [0] * REGISTER_COUNT
         assert cpu.pc == ROM_START_IDX
         assert cpu.i == 0
         assert cpu.sp == 0
-        assert cpu.stack == [0] * STACK_SIZE
+        assert list(cpu.stack) == [0] * STACK_SIZE
         assert cpu.delay_timer == 0
         assert cpu.sound_timer == 0
-        assert cpu.pc_modified is False
         assert cpu.waiting_for_key is False
 
     def test_cpu_stores_component_references(self):
@@ -83,8 +91,8 @@ class TestCycleExecution:
         memory.read_word.assert_not_called()
         assert cpu.waiting_for_key is True
 
-    def test_cycle_pc_modified_prevents_increment(self):
-        """When pc_modified is True, PC should not auto-increment."""
+    def test_cycle_jump_prevents_increment(self):
+        """When a handler sets PC itself, PC should not auto-increment."""
         memory = Mock(spec=Memory)
         display = Mock(spec=Display)
         input_ = Mock(spec=Input_)
@@ -99,6 +107,23 @@ class TestCycleExecution:
         assert cpu.pc == 0x200  # Should be at jump destination
         assert cpu.pc != initial_pc + 2  # Should not have incremented
 
+    def test_run_executes_batch_of_cycles(self):
+        """run(n) should execute n consecutive instructions."""
+        memory = Mock(spec=Memory)
+        display = Mock(spec=Display)
+        input_ = Mock(spec=Input_)
+        
+        memory.read_word.side_effect = [0x6101, 0x7101, 0x7101]  # V1 = 1, then += 1 twice
+        
+        cpu = CPU(memory, display, input_)
+        initial_pc = cpu.pc
+        
+        cpu.run(3)
+        
+        assert memory.read_word.call_count == 3
+        assert cpu.registers[1] == 3
+        assert cpu.pc == initial_pc + 6
+
 
 class TestSystemControlOpcodes:
     def test_clear_screen_00E0(self):
@@ -543,12 +568,11 @@ class TestRandomOpcode:
 class TestDisplayOpcodes:
     def test_draw_sprite_Dxyn(self):
         """Dxyn should draw sprite and set VF on collision."""
-        memory = Mock(spec=Memory)
+        # Draw at V1,V2, height 3, sprite data at I
+        memory = FakeMemory([0xD123], data=[0xF0, 0x90, 0x90], base=0x300)
         display = Mock(spec=Display)
         input_ = Mock(spec=Input_)
         
-        memory.read_word.return_value = 0xD123  # Draw at V1,V2, height 3
-        memory.read_byte.side_effect = [0xF0, 0x90, 0x90]  # Sprite data
         display.draw_sprite.return_value = True  # Collision
         
         cpu = CPU(memory, display, input_)
@@ -557,7 +581,7 @@ class TestDisplayOpcodes:
         cpu.i = 0x300
         cpu.cycle()
         
-        display.draw_sprite.assert_called_once_with(10, 20, [0xF0, 0x90, 0x90])
+        display.draw_sprite.assert_called_once_with(10, 20, bytes([0xF0, 0x90, 0x90]))
         assert cpu.registers[VF_IDX] == 1  # Collision flag
 
 
@@ -586,16 +610,32 @@ class TestInputOpcodes:
         input_ = Mock(spec=Input_)
         
         memory.read_word.return_value = 0xE1A1
-        input_.key_not_pressed.return_value = True
+        input_.key_pressed.return_value = False
         
         cpu = CPU(memory, display, input_)
         cpu.registers[1] = 0x5
         initial_pc = cpu.pc
         cpu.cycle()
         
-        input_.key_not_pressed.assert_called_once_with(0x5)
+        input_.key_pressed.assert_called_once_with(0x5)
         assert cpu.pc == initial_pc + 4
 
+    def test_no_skip_if_key_pressed_ExA1(self):
+        """ExA1 should not skip while key Vx is pressed."""
+        memory = Mock(spec=Memory)
+        display = Mock(spec=Display)
+        input_ = Mock(spec=Input_)
+        
+        memory.read_word.return_value = 0xE1A1
+        input_.key_pressed.return_value = True
+        
+        cpu = CPU(memory, display, input_)
+        cpu.registers[1] = 0x5
+        initial_pc = cpu.pc
+        cpu.cycle()
+        
+        assert cpu.pc == initial_pc + 2
+
     def test_wait_for_key_Fx0A(self):
         """Fx0A should wait for key press."""
         memory = Mock(spec=Memory)
@@ -655,11 +695,8 @@ class TestTimerOpcodes:
         
         assert cpu.registers[1] == 0x42
 
-    @patch('core.cpu.perf_counter')
-    def test_update_timers_decrements_at_60hz(self, mock_perf_counter):
-        """Timers should decrement at 60Hz."""
-        mock_perf_counter.side_effect = [0.0, 1.0/60 + 0.001]  # Just over 60Hz
-        
+    def test_update_timers_decrements_once_per_call(self):
+        """Each call is one 60Hz tick and decrements both timers by one."""
         memory = Mock(spec=Memory)
         display = Mock(spec=Display)
         input_ = Mock(spec=Input_)
@@ -667,12 +704,16 @@ class TestTimerOpcodes:
         cpu = CPU(memory, display, input_)
         cpu.delay_timer = 5
         cpu.sound_timer = 3
-        cpu.last_timer_update = 0.0
         
         cpu.update_timers()
         
         assert cpu.delay_timer == 4
         assert cpu.sound_timer == 2
+        
+        cpu.update_timers()
+        
+        assert cpu.delay_timer == 3
+        assert cpu.sound_timer == 1
 
 
 class TestBCDAndMemoryOpcodes:
@@ -709,9 +750,10 @@ class TestBCDAndMemoryOpcodes:
         cpu.i = 0x300
         cpu.cycle()
         
-        memory.write_byte.assert_any_call(0x300, 0x10)
-        memory.write_byte.assert_any_call(0x301, 0x20)
-        memory.write_byte.assert_any_call(0x302, 0x30)
+        memory.write_bytes.assert_called_once()
+        addr, values = memory.write_bytes.call_args.args
+        assert addr == 0x300
+        assert bytes(values) == bytes([0x10, 0x20, 0x30])
 
     def test_load_registers_Fx65(self):
         """Fx65 should load V0-Vx from memory."""
@@ -720,12 +762,14 @@ class TestBCDAndMemoryOpcodes:
         input_ = Mock(spec=Input_)
         
         memory.read_word.return_value = 0xF265
-        memory.read_byte.side_effect = [0x10, 0x20, 0x30]
+        memory.read_bytes.return_value = bytes([0x10, 0x20, 0x30])
         
         cpu = CPU(memory, display, input_)
         cpu.i = 0x300
         cpu.cycle()
         
+        memory.read_bytes.assert_called_once_with(0x300, 3)
+        
         assert cpu.registers[0] == 0x10
         assert cpu.registers[1] == 0x20
         assert cpu.registers[2] == 0x30
@@ -932,8 +976,7 @@ class TestEdgeCases:
         cpu.delay_timer = 0
         cpu.sound_timer = 0
         
-        with patch('core.cpu.perf_counter', side_effect=[0.0, 1.0/60 + 0.001]):
-            cpu.update_timers()
+        cpu.update_timers()
         
         assert cpu.delay_timer == 0
         assert cpu.sound_timer == 0
@@ -954,10 +997,11 @@ class TestEdgeCases:
         
         cpu.cycle()
         
-        # Should have called write_byte 16 times
-        assert memory.write_byte.call_count == 16
-        for i in range(16):
-            memory.write_byte.assert_any_call(0x300 + i, i * 10)
+        # Should have written all 16 registers in one block
+        memory.write_bytes.assert_called_once()
+        addr, values = memory.write_bytes.call_args.args
+        assert addr == 0x300
+        assert bytes(values) == bytes(i * 10 for i in range(16))
 
 
 class TestInstructionTiming:
@@ -977,8 +1021,8 @@ class TestInstructionTiming:
         assert cpu.registers[1] == 0x42  # Instruction executed
         assert cpu.pc == initial_pc + 2  # PC incremented
 
-    def test_pc_modified_flag_reset(self):
-        """pc_modified flag should reset after each cycle."""
+    def test_pc_increment_resumes_after_jump(self):
+        """PC should auto-increment again on the cycle after a jump."""
         memory = Mock(spec=Memory)
         display = Mock(spec=Display)
         input_ = Mock(spec=Input_)
@@ -989,15 +1033,37 @@ class TestInstructionTiming:
         
         # First cycle: jump instruction
         cpu.cycle()
-        assert cpu.pc_modified is False  # Should be reset
         assert cpu.pc == 0x234
         
         # Second cycle: normal instruction
         saved_pc = cpu.pc
         cpu.cycle()
-        assert cpu.pc_modified is False
         assert cpu.pc == saved_pc + 2
 
+    def test_cycle_throughput(self):
+        """CPU should sustain well above the emulator's target instruction rate."""
+        memory = Memory()
+        display = Mock(spec=Display)
+        input_ = Mock(spec=Input_)
+
+        cycles = 1000
+        for addr in range(ROM_START_IDX, ROM_START_IDX + 2 * cycles, 2):
+            memory.write_byte(addr, 0x61)  # 6142: Set V1 to 0x42
+            memory.write_byte(addr + 1, 0x42)
+
+        cpu = CPU(memory, display, input_)
+
+        best = float("inf")
+        for _ in range(5):
+            cpu.pc = ROM_START_IDX
+            start = perf_counter()
+            for _ in range(cycles):
+                cpu.cycle()
+            best = min(best, perf_counter() - start)
+
+        assert cpu.pc == ROM_START_IDX + 2 * cycles
+        assert cycles / best >= MIN_BENCHMARK_IPS
+
 
 class TestComplexScenarios:
     def test_nested_subroutine_calls(self):
@@ -1060,14 +1126,13 @@ class TestComplexScenarios:
 
     def test_sprite_drawing_integration(self):
         """Should integrate properly with display for sprite drawing."""
-        memory = Mock(spec=Memory)
+        # Setup sprite data
+        sprite_data = [0xF0, 0x90, 0x90, 0x90, 0xF0]  # Font '0'
+        # Draw at V1,V2, height 5
+        memory = FakeMemory([0xD125], data=sprite_data, base=0x050)
         display = Mock(spec=Display)
         input_ = Mock(spec=Input_)
         
-        # Setup sprite data
-        sprite_data = [0xF0, 0x90, 0x90, 0x90, 0xF0]  # Font '0'
-        memory.read_word.return_value = 0xD125  # Draw at V1,V2, height 5
-        memory.read_byte.side_effect = sprite_data
         display.draw_sprite.return_value = False  # No collision
         
         cpu = CPU(memory, display, input_)
@@ -1077,12 +1142,11 @@ class TestComplexScenarios:
         
         cpu.cycle()
         
-        # Verify memory reads for sprite data
-        for i in range(5):
-            memory.read_byte.assert_any_call(0x050 + i)
+        # Verify sprite data was read as one block from I
+        assert ("read_bytes", 0x050) in memory.calls
         
         # Verify display call
-        display.draw_sprite.assert_called_once_with(10, 15, sprite_data)
+        display.draw_sprite.assert_called_once_with(10, 15, bytes(sprite_data))
         
         # Verify collision flag
         assert cpu.registers[VF_IDX] == 0  # No collision
\ No newline at end of file
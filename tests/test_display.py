@@ -17,29 +17,29 @@ from io import StringIO
 from core.display import Display
 
 
+def set_pixel(screen, x, y, on=True):
+    """Set or clear a single pixel in a packed row buffer."""
+    bit = 1 << (63 - x)
+    screen[y] = screen[y] | bit if on else screen[y] & ~bit
+
+
 class TestDisplayInitialization:
     def test_display_initializes_with_correct_dimensions(self):
         """Display should initialize with 64x32 screen."""
         with patch('builtins.print'):
             display = Display()
         
+        # Width is fixed by packing each row into a 64-bit word
         assert len(display.screen) == 32  # Height
-        assert len(display.screen[0]) == 64  # Width
         assert len(display.prev_screen) == 32
-        assert len(display.prev_screen[0]) == 64
 
     def test_display_initializes_all_pixels_false(self):
         """All pixels should be False (off) initially."""
         with patch('builtins.print'):
             display = Display()
         
-        for row in display.screen:
-            for pixel in row:
-                assert pixel is False
-        
-        for row in display.prev_screen:
-            for pixel in row:
-                assert pixel is False
+        assert display.screen == [0] * 32
+        assert display.prev_screen == [0] * 32
 
     @patch('sys.platform', 'win32')
     @patch('os.system')
@@ -74,25 +74,24 @@ class TestClearScreen:
             display = Display()
         
         # Set some pixels to True first
-        display.screen[5][10] = True
-        display.screen[15][25] = True
-        display.screen[30][60] = True
+        set_pixel(display.screen, 10, 5)
+        set_pixel(display.screen, 25, 15)
+        set_pixel(display.screen, 60, 30)
         
         display.clear_screen()
         
-        for row in display.screen:
-            for pixel in row:
-                assert pixel is False
+        assert display.screen == [0] * 32
 
     def test_clear_screen_preserves_dimensions(self):
         """clear_screen should maintain screen dimensions."""
         with patch('builtins.print'):
             display = Display()
         
+        display.draw_sprite(56, 31, [0xFF, 0xFF])
         display.clear_screen()
         
         assert len(display.screen) == 32
-        assert len(display.screen[0]) == 64
+        assert display.screen == [0] * 32
 
     def test_clear_screen_doesnt_affect_prev_screen(self):
         """clear_screen should not modify prev_screen."""
@@ -100,10 +99,10 @@ class TestClearScreen:
             display = Display()
         
         # Set some pixels in prev_screen
-        display.prev_screen[5][10] = True
-        display.prev_screen[15][25] = True
+        set_pixel(display.prev_screen, 10, 5)
+        set_pixel(display.prev_screen, 25, 15)
         
-        original_prev_screen = [row[:] for row in display.prev_screen]
+        original_prev_screen = list(display.prev_screen)
         
         display.clear_screen()
         
@@ -122,10 +121,10 @@ class TestSpriteDrawing:
         
         collision = display.draw_sprite(0, 0, sprite_data)
         
-        assert display.screen[0][0] is True   # First row, first pixel
-        assert display.screen[0][1] is True   # First row, second pixel
-        assert display.screen[1][0] is True   # Second row, first pixel
-        assert display.screen[1][1] is False  # Second row, second pixel
+        assert display.pixel(0, 0) is True   # First row, first pixel
+        assert display.pixel(1, 0) is True   # First row, second pixel
+        assert display.pixel(0, 1) is True   # Second row, first pixel
+        assert display.pixel(1, 1) is False  # Second row, second pixel
         assert collision is False
 
     def test_draw_sprite_with_collision(self):
@@ -134,7 +133,7 @@ class TestSpriteDrawing:
             display = Display()
         
         # Set a pixel that will collide
-        display.screen[0][0] = True
+        set_pixel(display.screen, 0, 0)
         
         # Draw sprite that overlaps
         sprite_data = [0b11000000]  # 0xC0
@@ -142,8 +141,8 @@ class TestSpriteDrawing:
         collision = display.draw_sprite(0, 0, sprite_data)
         
         assert collision is True
-        assert display.screen[0][0] is False  # XOR: True ^ True = False
-        assert display.screen[0][1] is True   # XOR: False ^ True = True
+        assert display.pixel(0, 0) is False  # XOR: True ^ True = False
+        assert display.pixel(1, 0) is True   # XOR: False ^ True = True
 
     def test_draw_sprite_xor_logic(self):
         """Should use XOR logic for pixel drawing."""
@@ -151,10 +150,10 @@ class TestSpriteDrawing:
             display = Display()
         
         # Set some existing pixels
-        display.screen[0][0] = True
-        display.screen[0][1] = False
-        display.screen[0][2] = True
-        display.screen[0][3] = False
+        set_pixel(display.screen, 0, 0)
+        set_pixel(display.screen, 1, 0, False)
+        set_pixel(display.screen, 2, 0)
+        set_pixel(display.screen, 3, 0, False)
         
         # Draw sprite: 1010 (0xA0)
         sprite_data = [0b10100000]
@@ -162,10 +161,10 @@ class TestSpriteDrawing:
         collision = display.draw_sprite(0, 0, sprite_data)
         
         # XOR results:
-        assert display.screen[0][0] is False  # True ^ True = False
-        assert display.screen[0][1] is False   # False ^ False = False
-        assert display.screen[0][2] is False  # True ^ True = False
-        assert display.screen[0][3] is False  # False ^ False = False
+        assert display.pixel(0, 0) is False  # True ^ True = False
+        assert display.pixel(1, 0) is False   # False ^ False = False
+        assert display.pixel(2, 0) is False  # True ^ True = False
+        assert display.pixel(3, 0) is False  # False ^ False = False
         assert collision is True  # Collision on pixels 0 and 2
 
     def test_draw_sprite_wrapping_horizontal(self):
@@ -178,8 +177,8 @@ class TestSpriteDrawing:
         
         collision = display.draw_sprite(63, 0, sprite_data)
         
-        assert display.screen[0][63] is True  # Last column
-        assert display.screen[0][0] is True   # Wrapped to first column
+        assert display.pixel(63, 0) is True  # Last column
+        assert display.pixel(0, 0) is True   # Wrapped to first column
         assert collision is False
 
     def test_draw_sprite_wrapping_vertical(self):
@@ -192,8 +191,8 @@ class TestSpriteDrawing:
         
         collision = display.draw_sprite(0, 31, sprite_data)
         
-        assert display.screen[31][0] is True  # Last row
-        assert display.screen[0][0] is True   # Wrapped to first row
+        assert display.pixel(0, 31) is True  # Last row
+        assert display.pixel(0, 0) is True   # Wrapped to first row
         assert collision is False
 
     def test_draw_sprite_at_various_positions(self):
@@ -207,7 +206,7 @@ class TestSpriteDrawing:
             sprite_data = [0b10000000]  # Single pixel
             collision = display.draw_sprite(x, y, sprite_data)
             
-            assert display.screen[y][x] is True
+            assert display.pixel(x, y) is True
             assert collision is False
 
     def test_draw_empty_sprite(self):
@@ -219,9 +218,7 @@ class TestSpriteDrawing:
         
         assert collision is False
         # No pixels should be affected
-        for row in display.screen:
-            for pixel in row:
-                assert pixel is False
+        assert display.screen == [0] * 32
 
     def test_draw_sprite_all_zeros(self):
         """Should handle sprite with all zero bytes."""
@@ -233,9 +230,7 @@ class TestSpriteDrawing:
         
         assert collision is False
         # No pixels should be set
-        for row in display.screen:
-            for pixel in row:
-                assert pixel is False
+        assert display.screen == [0] * 32
 
     def test_draw_sprite_all_ones(self):
         """Should handle sprite with all 0xFF bytes."""
@@ -249,7 +244,7 @@ class TestSpriteDrawing:
         # First 8 pixels of first two rows should be True
         for row_idx in range(2):
             for col_idx in range(8):
-                assert display.screen[row_idx][col_idx] is True
+                assert display.pixel(col_idx, row_idx) is True
 
     def test_draw_complex_sprite_pattern(self):
         """Should draw complex sprite patterns correctly."""
@@ -266,15 +261,15 @@ class TestSpriteDrawing:
         collision = display.draw_sprite(10, 10, cross_sprite)
         
         # Verify cross pattern
-        assert display.screen[10][12] is True  # Top center
-        assert display.screen[11][11] is True  # Middle left
-        assert display.screen[11][12] is True  # Middle center
-        assert display.screen[11][13] is True  # Middle right
-        assert display.screen[12][12] is True  # Bottom center
+        assert display.pixel(12, 10) is True  # Top center
+        assert display.pixel(11, 11) is True  # Middle left
+        assert display.pixel(12, 11) is True  # Middle center
+        assert display.pixel(13, 11) is True  # Middle right
+        assert display.pixel(12, 12) is True  # Bottom center
         
         # Verify surrounding pixels are False
-        assert display.screen[10][11] is False
-        assert display.screen[10][13] is False
+        assert display.pixel(11, 10) is False
+        assert display.pixel(13, 10) is False
         assert collision is False
 
 
@@ -284,7 +279,7 @@ class TestCollisionDetection:
         with patch('builtins.print'):
             display = Display()
         
-        display.screen[5][5] = True
+        set_pixel(display.screen, 5, 5)
         sprite_data = [0b00010000]  # Single pixel at bit position 3
         
         collision = display.draw_sprite(2, 5, sprite_data)  # x=2, so pixel lands at 2+3=5
@@ -297,8 +292,8 @@ class TestCollisionDetection:
             display = Display()
         
         # Set multiple existing pixels
-        display.screen[10][10] = True
-        display.screen[10][12] = True
+        set_pixel(display.screen, 10, 10)
+        set_pixel(display.screen, 12, 10)
         
         # Draw sprite that overlaps both
         sprite_data = [0b10100000]  # Pixels at positions 0 and 2
@@ -313,8 +308,8 @@ class TestCollisionDetection:
             display = Display()
         
         # Set existing pixels
-        display.screen[5][5] = True
-        display.screen[5][7] = True
+        set_pixel(display.screen, 5, 5)
+        set_pixel(display.screen, 7, 5)
         
         # Draw sprite between them
         sprite_data = [0b01000000]  # Single pixel at position 1
@@ -322,7 +317,7 @@ class TestCollisionDetection:
         collision = display.draw_sprite(5, 5, sprite_data)  # Lands at position 6
         
         assert collision is False
-        assert display.screen[5][6] is True  # New pixel should be set
+        assert display.pixel(6, 5) is True  # New pixel should be set
 
     def test_collision_across_multiple_rows(self):
         """Should detect collision across multiple sprite rows."""
@@ -330,8 +325,8 @@ class TestCollisionDetection:
             display = Display()
         
         # Set pixels in different rows
-        display.screen[8][10] = True
-        display.screen[10][12] = True
+        set_pixel(display.screen, 10, 8)
+        set_pixel(display.screen, 12, 10)
         
         sprite_data = [
             0b10000000,  # Row 8, pixel 10
@@ -358,21 +353,46 @@ class TestScreenRefresh:
         final_call = mock_print.call_args_list[-1]
         assert final_call == call("", end="", flush=True)
 
+    @patch('builtins.print')
+    def test_refresh_renders_heavily_changed_row_whole(self, mock_print, capsys):
+        """refresh should redraw a mostly-changed row with one cursor move."""
+        display = Display()
+        for x in range(0, 64, 2):
+            set_pixel(display.screen, x, 3)
+        
+        display.refresh()
+        
+        output = capsys.readouterr().out
+        assert output == "\033[4;1H" + "██  " * 32
+        assert display.prev_screen == display.screen
+
+    @patch('builtins.print')
+    def test_refresh_unchanged_frame_writes_nothing(self, mock_print, capsys):
+        """refresh should emit no escape sequences for an unchanged frame."""
+        display = Display()
+        set_pixel(display.screen, 5, 5)
+        display.refresh()
+        capsys.readouterr()
+        
+        display.refresh()
+        
+        assert capsys.readouterr().out == ""
+        assert mock_print.call_args_list[-1] == call("", end="", flush=True)
+
     @patch('builtins.print')
     def test_refresh_updates_prev_screen(self, mock_print):
         """refresh should update prev_screen to match current screen."""
         display = Display()
         
         # Change some pixels
-        display.screen[1][2] = True
-        display.screen[3][4] = False  # Already False, but testing
+        set_pixel(display.screen, 2, 1)
+        set_pixel(display.screen, 4, 3, False)  # Already False, but testing
         
         display.refresh()
         
         # prev_screen should now match screen
-        for row_idx in range(32):
-            for col_idx in range(64):
-                assert display.prev_screen[row_idx][col_idx] == display.screen[row_idx][col_idx]
+        assert display.prev_screen == display.screen
+        assert display.prev_screen is not display.screen
 
 class TestEdgeCases:
     def test_sprite_drawing_maximum_size(self):
@@ -388,7 +408,7 @@ class TestEdgeCases:
         # First 8 pixels of first 15 rows should be True
         for row_idx in range(15):
             for col_idx in range(8):
-                assert display.screen[row_idx][col_idx] is True
+                assert display.pixel(col_idx, row_idx) is True
         
         assert collision is False
 
@@ -403,10 +423,10 @@ class TestEdgeCases:
         collision = display.draw_sprite(63, 31, sprite_data)
         
         # Should wrap to all four corners
-        assert display.screen[31][63] is True  # Bottom-right
-        assert display.screen[31][0] is True   # Bottom-left (wrapped)
-        assert display.screen[0][63] is True   # Top-right (wrapped)
-        assert display.screen[0][0] is True    # Top-left (wrapped both ways)
+        assert display.pixel(63, 31) is True  # Bottom-right
+        assert display.pixel(0, 31) is True   # Bottom-left (wrapped)
+        assert display.pixel(63, 0) is True   # Top-right (wrapped)
+        assert display.pixel(0, 0) is True    # Top-left (wrapped both ways)
         assert collision is False
 
     def test_screen_state_isolation(self):
@@ -416,13 +436,11 @@ class TestEdgeCases:
             display2 = Display()
         
         # Modify first display
-        display1.screen[5][5] = True
+        set_pixel(display1.screen, 5, 5)
         display1.draw_sprite(10, 10, [0xFF])
         
         # Second display should be unaffected
-        for row in display2.screen:
-            for pixel in row:
-                assert pixel is False
+        assert display2.screen == [0] * 32
 
     def test_large_coordinate_values(self):
         """Should handle large coordinate values with proper wrapping."""
@@ -435,7 +453,7 @@ class TestEdgeCases:
         collision = display.draw_sprite(100, 50, sprite_data)  # Will wrap
         
         # 100 % 64 = 36, 50 % 32 = 18
-        assert display.screen[18][36] is True
+        assert display.pixel(36, 18) is True
         assert collision is False
 
     def test_binary_string_formatting_edge_cases(self):
@@ -455,7 +473,7 @@ class TestEdgeCases:
             bit_string = format(byte_val, "08b")
             for bit_idx, bit_char in enumerate(bit_string):
                 expected_state = bit_char == "1"
-                assert display.screen[0][bit_idx] == expected_state
+                assert display.pixel(bit_idx, 0) == expected_state
             
             assert collision is False
 
@@ -479,7 +497,7 @@ class TestIntegrationScenarios:
         expected_result = [True, False, False, False, True, False, False, False]
         
         for i in range(8):
-            assert display.screen[0][i] == expected_result[i]
+            assert display.pixel(i, 0) == expected_result[i]
         
         assert collision1 is False
         assert collision2 is True  # Collision on overlapping bits
@@ -494,27 +512,25 @@ class TestIntegrationScenarios:
         display.draw_sprite(10, 10, sprite_data)
         
         # Verify pixels are set
-        assert display.screen[10][10] is True
-        assert display.screen[11][10] is True
+        assert display.pixel(10, 10) is True
+        assert display.pixel(10, 11) is True
         
         # Clear screen
         display.clear_screen()
         
         # Verify all pixels are off
-        for row in display.screen:
-            for pixel in row:
-                assert pixel is False
+        assert display.screen == [0] * 32
         
         # Redraw same pattern
         collision = display.draw_sprite(10, 10, sprite_data)
         
         # Should be identical to first draw
-        assert display.screen[10][10] is True
-        assert display.screen[11][10] is True
+        assert display.pixel(10, 10) is True
+        assert display.pixel(10, 11) is True
         assert collision is False
 
     @patch('builtins.print')
-    def test_refresh_after_multiple_operations(self, mock_print):
+    def test_refresh_after_multiple_operations(self, mock_print, capsys):
         """Should handle refresh after complex drawing operations."""
         display = Display()
         
@@ -530,5 +546,7 @@ class TestIntegrationScenarios:
         final_call = mock_print.call_args_list[-1]
         assert final_call == call("", end="", flush=True)
         
-        # Should have output for changed pixels
-        assert mock_print.call_count > 1
\ No newline at end of file
+        # Should have output for changed pixels, written as one batch
+        output = capsys.readouterr().out
+        assert "\033[1;1H██" in output  # (0, 0) is still on after the overlap
+        assert "\033[17;65H██" in output  # Top-left of the second sprite
\ No newline at end of file
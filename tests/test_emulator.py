@@ -0,0 +1,90 @@
+"""
+Emulator Loop Tests for CHIP-8 Emulator
+
+Drives the main loop against a fake monotonic clock to check frame pacing
+and the rate at which the delay and sound timers count down.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from core.emulator import Emulator
+from core.input_ import Input_
+
+
+class StopEmulation(Exception):
+    """Raised by the fake display to break out of the endless loop."""
+
+
+class FakeClock:
+    """
+    Monotonic clock advanced by emulated work and by sleeps.
+
+    Each sleep overshoots by a fixed amount, like a real scheduler would.
+    """
+
+    def __init__(self, overshoot: float):
+        self.now = 0.0
+        self.overshoot = overshoot
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds + self.overshoot
+
+
+def run_frames(emulator, clock, frames, work_per_frame):
+    """Run the emulation loop until the display has refreshed `frames` + 1 times."""
+    refreshes = 0
+
+    def refresh():
+        nonlocal refreshes
+        refreshes += 1
+        if refreshes > frames:
+            raise StopEmulation
+
+    def run(cycles):
+        clock.now += work_per_frame
+
+    emulator.input_ = Mock(spec=Input_)
+    emulator.display.refresh = refresh
+    emulator.cpu.run = run
+    with patch("core.emulator.perf_counter", clock.perf_counter), \
+         patch("core.emulator.sleep", clock.sleep):
+        with pytest.raises(StopEmulation):
+            emulator.emulate()
+
+
+class TestFramePacing:
+    def test_frames_run_at_60hz(self, capsys):
+        """Frames should be 1/60 s apart on average."""
+        emulator = Emulator(None)
+        clock = FakeClock(overshoot=50e-6)
+
+        run_frames(emulator, clock, 60, work_per_frame=0.3e-3)
+
+        # 61 frames started; the last stops at its refresh, after its sleep
+        assert clock.now == pytest.approx(61 / 60, abs=1e-3)
+
+    def test_timers_count_down_at_60hz(self, capsys):
+        """The delay and sound timers should tick once per frame, 60 times a second."""
+        emulator = Emulator(None)
+        emulator.cpu.delay_timer = 255
+        emulator.cpu.sound_timer = 255
+        clock = FakeClock(overshoot=50e-6)
+
+        run_frames(emulator, clock, 60, work_per_frame=0.3e-3)
+
+        assert 255 - emulator.cpu.delay_timer == 60
+        assert 255 - emulator.cpu.sound_timer == 60
+
+    def test_timers_keep_rate_when_host_falls_behind(self, capsys):
+        """A slow host gets fewer frames, but still exactly one timer tick per frame."""
+        emulator = Emulator(None)
+        emulator.cpu.delay_timer = 255
+        clock = FakeClock(overshoot=50e-6)
+
+        run_frames(emulator, clock, 30, work_per_frame=0.02)
+
+        assert 255 - emulator.cpu.delay_timer == 30
@@ -6,8 +6,9 @@ CHIP-8 uses a 16-key hexadecimal keypad (0-F) mapped to QWERTY keys.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
+import core.input_
 from core.input_ import Input_
 
 
@@ -78,65 +79,78 @@ class TestKeyboardMapping:
         
         for qwerty_key, expected_chip8 in expected_mappings.items():
             assert input_handler.qwerty_to_chip8[qwerty_key] == expected_chip8
+            assert core.input_._QWERTY[expected_chip8] == qwerty_key
 
 
 class TestKeyPressDetection:
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_pressed_when_key_is_down(self, mock_is_pressed):
+    def test_key_pressed_when_key_is_down(self, fake_pressed):
         """Should return True when specified CHIP-8 key is pressed."""
-        mock_is_pressed.return_value = True
+        fake_pressed.side_effect = lambda key: key == 'x'
         input_handler = Input_()
+        input_handler.poll()
         
         # Test with CHIP-8 key 0 (maps to 'x')
         result = input_handler.key_pressed(0x0)
         
         assert result is True
-        mock_is_pressed.assert_called_once_with('x')
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_pressed_when_key_is_up(self, mock_is_pressed):
+    def test_key_pressed_when_key_is_up(self, fake_pressed):
         """Should return False when specified CHIP-8 key is not pressed."""
-        mock_is_pressed.return_value = False
+        fake_pressed.side_effect = lambda key: key != 'w'
         input_handler = Input_()
+        input_handler.poll()
         
         result = input_handler.key_pressed(0x5)  # Maps to 'w'
         
         assert result is False
-        mock_is_pressed.assert_called_once_with('w')
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_not_pressed_when_key_is_down(self, mock_is_pressed):
+    def test_key_not_pressed_when_key_is_down(self, fake_pressed):
         """Should return False when key is pressed (inverted logic)."""
-        mock_is_pressed.return_value = True
+        fake_pressed.side_effect = lambda key: key == 'z'
         input_handler = Input_()
+        input_handler.poll()
         
         result = input_handler.key_not_pressed(0xA)  # Maps to 'z'
         
         assert result is False
-        mock_is_pressed.assert_called_once_with('z')
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_not_pressed_when_key_is_up(self, mock_is_pressed):
+    def test_key_not_pressed_when_key_is_up(self, fake_pressed):
         """Should return True when key is not pressed (inverted logic)."""
-        mock_is_pressed.return_value = False
+        fake_pressed.side_effect = lambda key: key != 'v'
         input_handler = Input_()
+        input_handler.poll()
         
         result = input_handler.key_not_pressed(0xF)  # Maps to 'v'
         
         assert result is True
-        mock_is_pressed.assert_called_once_with('v')
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_all_chip8_keys_can_be_checked(self, mock_is_pressed):
+    def test_all_chip8_keys_can_be_checked(self, fake_pressed):
         """Should be able to check all 16 CHIP-8 keys without errors."""
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
         input_handler = Input_()
+        input_handler.poll()
         
         for chip8_key in range(0x10):
             # Should not raise any exceptions
             result = input_handler.key_pressed(chip8_key)
             assert result is False
 
+    def test_key_pressed_answers_from_frame_snapshot(self, fake_pressed):
+        """key_pressed should not touch the keyboard between polls."""
+        fake_pressed.return_value = True
+        input_handler = Input_()
+        
+        # Nothing captured before the first poll
+        assert input_handler.key_pressed(0x3) is False
+        
+        input_handler.poll()
+        assert len(fake_pressed.calls) == 16
+        fake_pressed.calls.clear()
+        
+        assert input_handler.key_pressed(0x3) is True
+        assert input_handler.key_not_pressed(0xC) is False
+        assert fake_pressed.calls == []
+
     def test_invalid_chip8_key_raises_error(self):
         """Should raise KeyError for invalid CHIP-8 key codes."""
         input_handler = Input_()
@@ -149,8 +163,7 @@ class TestKeyPressDetection:
 
 
 class TestKeyStateTracking:
-    @patch('core.input_.keyboard.is_pressed')
-    def test_start_waiting_captures_initial_state(self, mock_is_pressed):
+    def test_start_waiting_captures_initial_state(self, fake_pressed):
         """start_waiting should capture current key states."""
         input_handler = Input_()
         
@@ -158,38 +171,38 @@ class TestKeyStateTracking:
         def mock_side_effect(key):
             return key in ['1', 'q']
         
-        mock_is_pressed.side_effect = mock_side_effect
+        fake_pressed.side_effect = mock_side_effect
         
+        input_handler.poll()
         input_handler.start_waiting()
         
         # Should have captured the initial state
-        expected_states = [False] * 16
-        expected_states[0x1] = True  # '1' key
-        expected_states[0x4] = True  # 'q' key
+        expected_states = 1 << 0x1 | 1 << 0x4  # '1' and 'q' keys
         
         assert input_handler.last_key_states == expected_states
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_check_keystates_changed_detects_new_press(self, mock_is_pressed):
+    def test_check_keystates_changed_detects_new_press(self, fake_pressed):
         """Should detect when a key transitions from not pressed to pressed."""
         input_handler = Input_()
         
         # Initial state: no keys pressed
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
+        input_handler.poll()
         input_handler.start_waiting()
         
         # Now 'x' (CHIP-8 key 0) gets pressed
         def mock_side_effect(key):
             return key == 'x'
         
-        mock_is_pressed.side_effect = mock_side_effect
+        fake_pressed.side_effect = mock_side_effect
+        
+        input_handler.poll()
         
         result = input_handler.check_keystates_changed()
         
         assert result == 0x0  # Should return CHIP-8 key 0
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_check_keystates_changed_ignores_already_pressed(self, mock_is_pressed):
+    def test_check_keystates_changed_ignores_already_pressed(self, fake_pressed):
         """Should ignore keys that were already pressed."""
         input_handler = Input_()
         
@@ -197,59 +210,64 @@ class TestKeyStateTracking:
         def initial_mock(key):
             return key == 'x'
         
-        mock_is_pressed.side_effect = initial_mock
+        fake_pressed.side_effect = initial_mock
+        input_handler.poll()
         input_handler.start_waiting()
         
         # 'x' still pressed - should return None
+        input_handler.poll()
         result = input_handler.check_keystates_changed()
         
         assert result is None
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_check_keystates_changed_returns_first_new_press(self, mock_is_pressed):
+    def test_check_keystates_changed_returns_first_new_press(self, fake_pressed):
         """Should return the first key that becomes newly pressed."""
         input_handler = Input_()
         
         # Initial state: no keys pressed
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
+        input_handler.poll()
         input_handler.start_waiting()
         
         # Multiple keys become pressed
         def mock_side_effect(key):
             return key in ['q', 'w']  # Both become pressed
         
-        mock_is_pressed.side_effect = mock_side_effect
+        fake_pressed.side_effect = mock_side_effect
+        
+        input_handler.poll()
         
         result = input_handler.check_keystates_changed()
         
         # Should return one of them (0x4 for 'q' or 0x5 for 'w')
         assert result in [0x4, 0x5]
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_check_keystates_changed_updates_last_states(self, mock_is_pressed):
+    def test_check_keystates_changed_updates_last_states(self, fake_pressed):
         """Should update last_key_states after checking."""
         input_handler = Input_()
         
         # Initial: no keys
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
+        input_handler.poll()
         input_handler.start_waiting()
         
         # New state: 'x' pressed
         def mock_side_effect(key):
             return key == 'x'
         
-        mock_is_pressed.side_effect = mock_side_effect
+        fake_pressed.side_effect = mock_side_effect
         
         # First check should detect the change
+        input_handler.poll()
         result1 = input_handler.check_keystates_changed()
         assert result1 == 0x0
         
         # Second check with same state should return None
+        input_handler.poll()
         result2 = input_handler.check_keystates_changed()
         assert result2 is None
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_check_keystates_changed_no_change_returns_none(self, mock_is_pressed):
+    def test_check_keystates_changed_no_change_returns_none(self, fake_pressed):
         """Should return None when no keys change state."""
         input_handler = Input_()
         
@@ -257,29 +275,92 @@ class TestKeyStateTracking:
         def mock_side_effect(key):
             return key in ['1', '2']
         
-        mock_is_pressed.side_effect = mock_side_effect
+        fake_pressed.side_effect = mock_side_effect
+        input_handler.poll()
         input_handler.start_waiting()
         
         # Check with same state should return None
+        input_handler.poll()
         result = input_handler.check_keystates_changed()
         
         assert result is None
 
 
+class TestKeyCodeResolution:
+    @patch('core.input_.keyboard.key_to_scan_codes')
+    def test_resolves_scan_codes(self, mock_scan_codes, monkeypatch):
+        """Key names should be mapped to all of their scan codes and cached."""
+        monkeypatch.setattr('core.input_._key_codes', None)
+        mock_scan_codes.side_effect = lambda name: (ord(name), ord(name) + 1000)
+        
+        key_codes = core.input_._resolve_key_codes()
+        
+        assert key_codes == tuple(
+            frozenset((ord(k), ord(k) + 1000)) for k in core.input_._QWERTY
+        )
+        assert core.input_._key_codes == key_codes
+        assert mock_scan_codes.call_count == 16
+
+    @patch('core.input_.keyboard.key_to_scan_codes')
+    def test_falls_back_to_key_names(self, mock_scan_codes, fake_pressed, monkeypatch):
+        """Unmappable platforms should keep polling by key name."""
+        monkeypatch.setattr('core.input_._key_codes', None)
+        mock_scan_codes.side_effect = ImportError("You must be root to use this library on linux.")
+        fake_pressed.return_value = True
+        
+        assert core.input_._resolve_key_codes() is core.input_._QWERTY
+        assert Input_()._key_states() == 0xFFFF
+        assert fake_pressed.calls == list(core.input_._QWERTY)
+
+    def test_key_states_reads_pressed_snapshot(self, fake_pressed, monkeypatch):
+        """Scan-code polling should read the pressed set once, not call is_pressed."""
+        scan_codes = tuple(frozenset((code,)) for code in range(100, 116))
+        monkeypatch.setattr('core.input_._key_codes', scan_codes)
+        monkeypatch.setattr('core.input_.keyboard._pressed_events', {100: None, 115: None})
+        monkeypatch.setattr('core.input_.keyboard._listener.start_if_necessary', lambda: None)
+        
+        key_states = Input_()._key_states()
+        
+        assert key_states == 1 << 0x0 | 1 << 0xF
+        assert fake_pressed.calls == []
+
+    @patch('core.input_.keyboard.key_to_scan_codes')
+    def test_key_with_several_scan_codes(self, mock_scan_codes, monkeypatch):
+        """A key should read as pressed when any of its scan codes is pressed."""
+        monkeypatch.setattr('core.input_._key_codes', None)
+        mock_scan_codes.side_effect = lambda name: (ord(name), ord(name) + 1000)
+        monkeypatch.setattr('core.input_.keyboard._pressed_events', {ord("1") + 1000: None})
+        monkeypatch.setattr('core.input_.keyboard._listener.start_if_necessary', lambda: None)
+        
+        key_states = Input_()._key_states()
+        
+        assert key_states == 1 << 0x1
+
+    def test_is_pressed_fallback_checks_every_scan_code(self, fake_pressed, monkeypatch):
+        """Without a pressed snapshot, each of a key's scan codes should be queried."""
+        scan_codes = tuple(frozenset((code, code + 1000)) for code in range(100, 116))
+        monkeypatch.setattr('core.input_._key_codes', scan_codes)
+        monkeypatch.setattr('core.input_._pressed_scan_codes', lambda: None)
+        fake_pressed.side_effect = lambda code: code == 1105
+        
+        key_states = Input_()._key_states()
+        
+        assert key_states == 1 << 0x5
+
+
 class TestKeyStatesHelper:
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_states_returns_16_booleans(self, mock_is_pressed):
-        """Should return list of 16 boolean values for all CHIP-8 keys."""
-        mock_is_pressed.return_value = False
+    def test_key_states_returns_16_bit_mask(self, fake_pressed):
+        """Should return a 16-bit mask covering all CHIP-8 keys."""
+        fake_pressed.return_value = False
         input_handler = Input_()
         
         key_states = input_handler._key_states()
         
-        assert len(key_states) == 16
-        assert all(isinstance(state, bool) for state in key_states)
+        assert isinstance(key_states, int)
+        assert 0 <= key_states <= 0xFFFF
+        assert len(fake_pressed.calls) == 16
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_states_reflects_actual_key_presses(self, mock_is_pressed):
+    def test_key_states_reflects_actual_key_presses(self, fake_pressed):
         """Key states should accurately reflect which keys are pressed."""
         input_handler = Input_()
         
@@ -287,38 +368,45 @@ class TestKeyStatesHelper:
         def mock_side_effect(key):
             return key in ['1', 'q']
         
-        mock_is_pressed.side_effect = mock_side_effect
+        fake_pressed.side_effect = mock_side_effect
         
         key_states = input_handler._key_states()
         
-        # Key 0x1 ('1') and 0x4 ('q') should be True, others False
-        expected_states = [False] * 16
-        expected_states[0x1] = True  # '1' key
-        expected_states[0x4] = True  # 'q' key
+        # Bits 0x1 ('1') and 0x4 ('q') should be set, others clear
+        expected_states = 1 << 0x1 | 1 << 0x4
         
         assert key_states == expected_states
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_states_all_keys_pressed(self, mock_is_pressed):
+    def test_key_states_all_keys_pressed(self, fake_pressed):
         """Should handle case where all keys are pressed."""
-        mock_is_pressed.return_value = True
+        fake_pressed.return_value = True
         input_handler = Input_()
         
         key_states = input_handler._key_states()
         
-        assert all(key_states)  # All should be True
-        assert len(key_states) == 16
+        assert key_states == 0xFFFF  # All 16 bits set
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_states_no_keys_pressed(self, mock_is_pressed):
+    def test_key_states_no_keys_pressed(self, fake_pressed):
         """Should handle case where no keys are pressed."""
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
+        input_handler = Input_()
+        
+        key_states = input_handler._key_states()
+        
+        assert key_states == 0  # No bits set
+
+    def test_key_states_uses_native_query_when_available(self, fake_pressed, monkeypatch):
+        """Should read virtual-key states natively instead of polling keyboard."""
+        def fake_get_async_key_state(vk):
+            return 0x8000 if vk in (ord('X'), ord('V')) else 0
+        
+        monkeypatch.setattr('core.input_._get_async_key_state', fake_get_async_key_state)
         input_handler = Input_()
         
         key_states = input_handler._key_states()
         
-        assert not any(key_states)  # All should be False
-        assert len(key_states) == 16
+        assert key_states == 1 << 0x0 | 1 << 0xF  # 'x' and 'v' keys
+        assert fake_pressed.calls == []
 
 
 class TestEdgeCases:
@@ -334,58 +422,53 @@ class TestEdgeCases:
         assert len(input_handler.qwerty_to_chip8) > 0
         assert len(input_handler.chip8_to_qwerty) > 0
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_multiple_input_handlers_independent(self, mock_is_pressed):
+    def test_multiple_input_handlers_independent(self, fake_pressed):
         """Multiple Input_ instances should work independently."""
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
         
         input1 = Input_()
         input2 = Input_()
         
-        # Should have identical but independent mappings
+        # Should share identical read-only mappings
         assert input1.qwerty_to_chip8 == input2.qwerty_to_chip8
         assert input1.chip8_to_qwerty == input2.chip8_to_qwerty
-        
-        # Should be different objects
-        assert input1.qwerty_to_chip8 is not input2.qwerty_to_chip8
+        with pytest.raises(TypeError):
+            input1.qwerty_to_chip8["x"] = 0x1
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_key_pressed_with_boundary_values(self, mock_is_pressed):
+    def test_key_pressed_with_boundary_values(self, fake_pressed):
         """Should handle boundary CHIP-8 key values correctly."""
-        from unittest.mock import call
-        
-        mock_is_pressed.return_value = True
+        fake_pressed.return_value = True
         input_handler = Input_()
+        input_handler.poll()
         
         # Test minimum and maximum valid keys
         assert input_handler.key_pressed(0x0) is True   # Minimum
         assert input_handler.key_pressed(0xF) is True   # Maximum
         
-        assert call('x') in mock_is_pressed.call_args_list
-        assert call('v') in mock_is_pressed.call_args_list
+        assert 'x' in fake_pressed.calls
+        assert 'v' in fake_pressed.calls
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_start_waiting_without_prior_state(self, mock_is_pressed):
+    def test_start_waiting_without_prior_state(self, fake_pressed):
         """start_waiting should work on first call without prior state."""
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
         input_handler = Input_()
         
         # Should not raise any exceptions
+        input_handler.poll()
         input_handler.start_waiting()
         
         # Should have captured initial state
-        assert hasattr(input_handler, 'last_key_states')
-        assert len(input_handler.last_key_states) == 16
+        assert input_handler.last_key_states == 0
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_check_keystates_changed_without_start_waiting(self, mock_is_pressed):
+    def test_check_keystates_changed_without_start_waiting(self, fake_pressed):
         """check_keystates_changed should handle case where start_waiting wasn't called."""
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
         input_handler = Input_()
         
         # This might raise AttributeError or handle gracefully depending on implementation
         # The current implementation expects start_waiting to be called first
         try:
+            input_handler.poll()
             result = input_handler.check_keystates_changed()
             # If it handles gracefully, result should be reasonable
             assert result is None or isinstance(result, int)
@@ -395,16 +478,17 @@ class TestEdgeCases:
 
 
 class TestIntegrationScenarios:
-    @patch('core.input_.keyboard.is_pressed')
-    def test_typical_key_waiting_workflow(self, mock_is_pressed):
+    def test_typical_key_waiting_workflow(self, fake_pressed):
         """Should handle typical key waiting workflow correctly."""
         input_handler = Input_()
         
         # Phase 1: Start waiting with no keys pressed
-        mock_is_pressed.return_value = False
+        fake_pressed.return_value = False
+        input_handler.poll()
         input_handler.start_waiting()
         
         # Phase 2: Check while no keys pressed - should return None
+        input_handler.poll()
         result1 = input_handler.check_keystates_changed()
         assert result1 is None
         
@@ -412,18 +496,19 @@ class TestIntegrationScenarios:
         def mock_side_effect(key):
             return key == 'x'
         
-        mock_is_pressed.side_effect = mock_side_effect
+        fake_pressed.side_effect = mock_side_effect
         
         # Should detect the new key press
+        input_handler.poll()
         result2 = input_handler.check_keystates_changed()
         assert result2 == 0x0
         
         # Phase 4: Same key still pressed - should return None
+        input_handler.poll()
         result3 = input_handler.check_keystates_changed()
         assert result3 is None
 
-    @patch('core.input_.keyboard.is_pressed')
-    def test_multiple_key_transitions(self, mock_is_pressed):
+    def test_multiple_key_transitions(self, fake_pressed):
         """Should handle multiple key state transitions correctly."""
         input_handler = Input_()
         
@@ -431,15 +516,34 @@ class TestIntegrationScenarios:
         def initial_state(key):
             return key == 'x'
         
-        mock_is_pressed.side_effect = initial_state
+        fake_pressed.side_effect = initial_state
+        input_handler.poll()
         input_handler.start_waiting()
         
         # Release 'x', press '1'
         def new_state(key):
             return key == '1'
         
-        mock_is_pressed.side_effect = new_state
+        fake_pressed.side_effect = new_state
         
         # Should detect the new key press (even though another was released)
+        input_handler.poll()
         result = input_handler.check_keystates_changed()
-        assert result == 0x1
\ No newline at end of file
+        assert result == 0x1
+
+    def test_key_waiting_reads_frame_snapshot(self, fake_pressed):
+        """Waiting for a key should not poll beyond the once-per-frame poll."""
+        input_handler = Input_()
+        input_handler.poll()
+        input_handler.start_waiting()
+        
+        fake_pressed.return_value = True
+        fake_pressed.calls.clear()
+        
+        # Without a new frame poll, nothing changes and nothing is polled
+        assert input_handler.check_keystates_changed() is None
+        assert fake_pressed.calls == []
+        
+        input_handler.poll()
+        assert input_handler.check_keystates_changed() == 0x0
+        assert len(fake_pressed.calls) == 16
@@ -9,7 +9,6 @@ Memory Layout:
 """
 
 import pytest
-from unittest.mock import patch, mock_open
 import tempfile
 import os
 
@@ -18,6 +17,26 @@ from core.errors import MemoryOutOfBoundsError, ByteOverflowError
 from configs import ROM_START_IDX, FONTSET_START_ADDRESS, MEMORY_SIZE_IN_BYTES, FONTSET
 
 
+def write_rom(tmp_path, data, name="test.ch8"):
+    """Write ROM bytes to a file under tmp_path and return its path."""
+    rom_path = tmp_path / name
+    rom_path.write_bytes(data)
+    return str(rom_path)
+
+
+@pytest.fixture(scope="module")
+def shared_memory():
+    """One Memory instance shared by every test in this module."""
+    return Memory()
+
+
+@pytest.fixture
+def m(shared_memory):
+    """The shared Memory, reset to its power-on state before each test."""
+    shared_memory.reset()
+    return shared_memory
+
+
 class TestMemoryInitialization:
     def test_memory_initialized_to_zero(self):
         """Memory should be initialized to all zeros except fontset area."""
@@ -55,11 +74,25 @@ class TestMemoryInitialization:
                 expected_byte = FONTSET[5 * digit + byte_offset]
                 assert actual_byte == expected_byte
 
+    def test_reset_restores_power_on_state(self, tmp_path):
+        """reset() should clear memory, restore the fontset and allow a new ROM."""
+        m = Memory()
+        m.load_rom(write_rom(tmp_path, b"\x12\x34"))
+        m.write_byte(0, 0xFF)
+        m.write_byte(FONTSET_START_ADDRESS, 0x00)
+        m.write_byte(MEMORY_SIZE_IN_BYTES - 1, 0xAB)
+        
+        m.reset()
+        
+        assert m.rom_loaded is False
+        assert m.read_bytes(0, MEMORY_SIZE_IN_BYTES) == Memory().read_bytes(0, MEMORY_SIZE_IN_BYTES)
+        m.load_rom(write_rom(tmp_path, b"\x56\x78", "next.ch8"))
+        assert m.read_word(ROM_START_IDX) == 0x5678
+
 
 class TestByteOperations:
-    def test_write_read_single_byte(self):
+    def test_write_read_single_byte(self, m):
         """Should be able to write and read single bytes."""
-        m = Memory()
         # Avoid fontset area (80-159), use safe addresses
         test_cases = [(200, 0xFF), (300, 0x42), (0, 0x00), (MEMORY_SIZE_IN_BYTES - 1, 0xAB)]
         
@@ -67,9 +100,8 @@ class TestByteOperations:
             m.write_byte(addr, value)
             assert m.read_byte(addr) == value
 
-    def test_write_read_boundary_values(self):
+    def test_write_read_boundary_values(self, m):
         """Should handle min/max byte values correctly."""
-        m = Memory()
         addr = 500
         
         # Test boundary values
@@ -80,9 +112,8 @@ class TestByteOperations:
         assert m.read_byte(addr) == 0xFF
 
     @pytest.mark.parametrize("addr", [0, MEMORY_SIZE_IN_BYTES - 1])
-    def test_write_read_at_memory_boundaries(self, addr):
+    def test_write_read_at_memory_boundaries(self, m, addr):
         """Should handle reads/writes at memory boundaries."""
-        m = Memory()
         value = 0x42
         
         m.write_byte(addr, value)
@@ -90,9 +121,8 @@ class TestByteOperations:
 
 
 class TestWordOperations:
-    def test_read_word_big_endian(self):
+    def test_read_word_big_endian(self, m):
         """Word operations should use big-endian byte order."""
-        m = Memory()
         addr = 1000
         
         # Write two bytes manually
@@ -103,10 +133,8 @@ class TestWordOperations:
         word = m.read_word(addr)
         assert word == 0x1234
 
-    def test_read_word_boundary_cases(self):
+    def test_read_word_boundary_cases(self, m):
         """Word reads should work at valid boundaries."""
-        m = Memory()
-        
         # Test at address 0
         m.write_byte(0, 0xAB)
         m.write_byte(1, 0xCD)
@@ -118,9 +146,8 @@ class TestWordOperations:
         m.write_byte(last_word_addr + 1, 0x01)
         assert m.read_word(last_word_addr) == 0xEF01
 
-    def test_read_word_with_zeros(self):
+    def test_read_word_with_zeros(self, m):
         """Word reads should handle zero values correctly."""
-        m = Memory()
         addr = 600
         
         # Memory initialized to zero, so word should be 0x0000
@@ -132,58 +159,94 @@ class TestWordOperations:
         assert m.read_word(addr) == 0x0042
 
 
+class TestBlockOperations:
+    def test_write_then_read_bytes(self, m):
+        """Block writes should be readable back as a block and per byte."""
+        addr = 0x300
+        data = bytes([0x10, 0x20, 0x30, 0xFF])
+        
+        m.write_bytes(addr, data)
+        
+        assert m.read_bytes(addr, len(data)) == data
+        for i, value in enumerate(data):
+            assert m.read_byte(addr + i) == value
+
+    def test_block_operations_at_memory_end(self, m):
+        """Block access should work up to the last byte of memory."""
+        addr = MEMORY_SIZE_IN_BYTES - 2
+        
+        m.write_bytes(addr, b"\xAB\xCD")
+        assert m.read_bytes(addr, 2) == b"\xAB\xCD"
+
+    def test_block_operations_out_of_bounds(self, m):
+        """Block access past the end of memory should raise."""
+        with pytest.raises(MemoryOutOfBoundsError):
+            m.read_bytes(MEMORY_SIZE_IN_BYTES - 1, 2)
+            
+        with pytest.raises(MemoryOutOfBoundsError):
+            m.write_bytes(MEMORY_SIZE_IN_BYTES - 1, b"\x01\x02")
+
+    def test_write_bytes_overflow(self, m):
+        """Block writes should reject values outside byte range."""
+        with pytest.raises(ByteOverflowError):
+            m.write_bytes(0x300, [1, 256])
+        assert m.read_byte(0x300) == 0
+
+
 class TestROMLoading:
-    def test_load_rom_basic(self):
+    def test_load_rom_basic(self, m, tmp_path):
         """Should load ROM data starting at ROM_START_IDX."""
         dummy_data = b"\x01\x02\x03\x04\xFF"
-        m = Memory()
         
-        with patch("core.memory.open", mock_open(read_data=dummy_data), create=True):
-            m.load_rom("test.ch8")
+        m.load_rom(write_rom(tmp_path, dummy_data))
         
         # Verify ROM data was loaded at correct location
         for i, byte_val in enumerate(dummy_data):
             assert m.read_byte(ROM_START_IDX + i) == byte_val
 
-    def test_load_rom_doesnt_overwrite_fontset(self):
+    def test_load_rom_doesnt_overwrite_fontset(self, m, tmp_path):
         """ROM loading should not affect fontset area."""
         dummy_data = b"\xFF" * 100  # Large ROM
-        m = Memory()
         
         # Store original fontset
         original_fontset = [m.read_byte(FONTSET_START_ADDRESS + i) for i in range(len(FONTSET))]
         
-        with patch("core.memory.open", mock_open(read_data=dummy_data), create=True):
-            m.load_rom("test.ch8")
+        m.load_rom(write_rom(tmp_path, dummy_data))
         
         # Verify fontset unchanged
         for i, expected_byte in enumerate(original_fontset):
             assert m.read_byte(FONTSET_START_ADDRESS + i) == expected_byte
 
-    def test_load_empty_rom(self):
+    def test_load_empty_rom(self, m, tmp_path):
         """Should handle empty ROM files gracefully."""
-        m = Memory()
-        
-        with patch("core.memory.open", mock_open(read_data=b""), create=True):
-            m.load_rom("empty.ch8")
+        m.load_rom(write_rom(tmp_path, b"", "empty.ch8"))
         
         # Memory at ROM area should remain zero
         assert m.read_byte(ROM_START_IDX) == 0
 
-    def test_load_large_rom(self):
+    def test_load_large_rom(self, m, tmp_path):
         """Should handle large ROM files that fill available space."""
         # Create ROM that fills from ROM_START_IDX to end of memory
         rom_size = MEMORY_SIZE_IN_BYTES - ROM_START_IDX
         dummy_data = bytes(range(256)) * (rom_size // 256) + bytes(range(rom_size % 256))
         
-        m = Memory()
-        with patch("core.memory.open", mock_open(read_data=dummy_data), create=True):
-            m.load_rom("large.ch8")
+        m.load_rom(write_rom(tmp_path, dummy_data, "large.ch8"))
         
         # Verify data loaded correctly
         for i in range(min(len(dummy_data), rom_size)):
             assert m.read_byte(ROM_START_IDX + i) == dummy_data[i]
 
+    def test_load_oversized_rom_is_truncated(self, m, tmp_path):
+        """ROM bytes past the end of memory should be dropped, not grow memory."""
+        rom_size = MEMORY_SIZE_IN_BYTES - ROM_START_IDX
+        dummy_data = b"\xAA" * rom_size + b"\xBB" * 16
+        
+        m.load_rom(write_rom(tmp_path, dummy_data, "huge.ch8"))
+        
+        assert m.read_byte(MEMORY_SIZE_IN_BYTES - 1) == 0xAA
+        with pytest.raises(MemoryOutOfBoundsError):
+            m.read_byte(MEMORY_SIZE_IN_BYTES)
+
     def test_load_rom_file_operations(self):
         """Should properly handle file operations."""
         # Test with actual temporary file
@@ -204,20 +267,16 @@ class TestROMLoading:
 
 
 class TestErrorConditions:
-    def test_read_byte_out_of_bounds(self):
+    def test_read_byte_out_of_bounds(self, m):
         """Should raise exception for out-of-bounds reads."""
-        m = Memory()
-        
         with pytest.raises(MemoryOutOfBoundsError):
             m.read_byte(MEMORY_SIZE_IN_BYTES)
             
         with pytest.raises(MemoryOutOfBoundsError):
             m.read_byte(MEMORY_SIZE_IN_BYTES + 1000)
 
-    def test_read_word_out_of_bounds(self):
+    def test_read_word_out_of_bounds(self, m):
         """Should raise exception for out-of-bounds word reads."""
-        m = Memory()
-        
         # Word read at last byte should fail (needs 2 bytes)
         with pytest.raises(MemoryOutOfBoundsError):
             m.read_word(MEMORY_SIZE_IN_BYTES - 1)
@@ -225,17 +284,13 @@ class TestErrorConditions:
         with pytest.raises(MemoryOutOfBoundsError):
             m.read_word(MEMORY_SIZE_IN_BYTES)
 
-    def test_write_byte_out_of_bounds(self):
+    def test_write_byte_out_of_bounds(self, m):
         """Should raise exception for out-of-bounds writes."""
-        m = Memory()
-        
         with pytest.raises(MemoryOutOfBoundsError):
             m.write_byte(MEMORY_SIZE_IN_BYTES, 0x42)
 
-    def test_write_byte_overflow(self):
+    def test_write_byte_overflow(self, m):
         """Should raise exception for byte overflow."""
-        m = Memory()
-        
         with pytest.raises(ByteOverflowError):
             m.write_byte(100, 256)
             
@@ -243,19 +298,16 @@ class TestErrorConditions:
             m.write_byte(100, 1000)
 
     @pytest.mark.parametrize("invalid_value", [256, 257, 1000, -1])
-    def test_write_byte_invalid_values(self, invalid_value):
+    def test_write_byte_invalid_values(self, m, invalid_value):
         """Should reject invalid byte values."""
-        m = Memory()
-        
         with pytest.raises((ByteOverflowError, ValueError)):
             m.write_byte(100, invalid_value)
 
 
 class TestSpriteOperations:
     @pytest.mark.parametrize("digit", range(0x10))
-    def test_all_sprite_addresses(self, digit):
+    def test_all_sprite_addresses(self, m, digit):
         """All 16 sprite addresses should be valid and correct."""
-        m = Memory()
         sprite_addr = m.get_sprite_address(digit)
         
         # Should point to correct location
@@ -267,10 +319,13 @@ class TestSpriteOperations:
             byte_val = m.read_byte(sprite_addr + i)
             assert 0 <= byte_val <= 255
 
-    def test_sprite_data_integrity(self):
+    def test_sprite_address_uses_low_nibble(self, m):
+        """Register values above 0xF should select the sprite for their low nibble."""
+        assert m.get_sprite_address(0x1A) == m.get_sprite_address(0xA)
+        assert m.get_sprite_address(0xFF) == m.get_sprite_address(0xF)
+
+    def test_sprite_data_integrity(self, m):
         """Sprite data should match expected fontset patterns."""
-        m = Memory()
-        
         # Test specific known sprites
         # Sprite for '0' should be: 0xF0, 0x90, 0x90, 0x90, 0xF0
         sprite_0_addr = m.get_sprite_address(0)
@@ -281,10 +336,8 @@ class TestSpriteOperations:
 
 
 class TestMemoryIsolation:
-    def test_operations_dont_interfere(self):
+    def test_operations_dont_interfere(self, m):
         """Different memory operations should not interfere with each other."""
-        m = Memory()
-        
         # Write to different areas (avoiding fontset area)
         m.write_byte(200, 0xAA)
         m.write_byte(300, 0xBB)
@@ -299,9 +352,8 @@ class TestMemoryIsolation:
         assert m.read_byte(250) == 0x00
         assert m.read_byte(350) == 0x00
 
-    def test_word_read_doesnt_affect_memory(self):
+    def test_word_read_doesnt_affect_memory(self, m):
         """Reading words should not modify memory."""
-        m = Memory()
         addr = 400
         
         m.write_byte(addr, 0x12)